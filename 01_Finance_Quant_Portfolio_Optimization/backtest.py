@@ -0,0 +1,143 @@
+"""
+Walk-forward backtest of the Markowitz optimizer.
+
+The portfolio is re-optimized at the first trading day of every month using only
+the last `window` days of log returns (no look-ahead). The window mean vector and
+covariance matrix are maintained incrementally: each day that enters the window is
+a rank-one update and each day that leaves is a rank-one downdate (Welford-style),
+so no full `.cov()` is recomputed at each step.
+
+Reports the daily equity curve, turnover per rebalance and realized Sharpe Ratio.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from frontier_solver import Caps, max_sharpe_portfolio, min_variance_portfolio
+from portfolio_engine import TRADING_DAYS
+
+
+class RollingMoments:
+    """Mean vector and covariance matrix of a sliding window, updated one observation at a time."""
+
+    def __init__(self, n_assets: int):
+        self.count = 0
+        self.mean = np.zeros(n_assets)
+        self._m2 = np.zeros((n_assets, n_assets))  # Sum of outer products of deviations
+
+    def add(self, x: np.ndarray):
+        """Rank-one update when a day enters the window."""
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += np.outer(delta, x - self.mean)
+
+    def remove(self, x: np.ndarray):
+        """Rank-one downdate when a day leaves the window."""
+        if self.count <= 1:
+            self.__init__(self.mean.shape[0])
+            return
+        self.count -= 1
+        delta = x - self.mean
+        self.mean -= delta / self.count
+        self._m2 -= np.outer(delta, x - self.mean)
+
+    @property
+    def cov(self) -> np.ndarray:
+        """Sample covariance (ddof=1, same as pandas `.cov()`)."""
+        cov = self._m2 / (self.count - 1)
+        return (cov + cov.T) / 2  # Keep it exactly symmetric despite rounding
+
+
+@dataclass
+class BacktestResult:
+    """Output of a walk-forward backtest."""
+    daily: pd.DataFrame        # Portfolio_Return (log), Equity per day
+    weights: pd.DataFrame      # Target weights at each rebalance date
+    turnover: pd.Series        # One-way turnover at each rebalance date
+    annual_return: float
+    annual_volatility: float
+    realized_sharpe: float
+    avg_turnover: float
+
+
+def walk_forward_backtest(log_returns: pd.DataFrame, window: int = TRADING_DAYS,
+                          risk_free_rate: float = 0.04, objective: str = 'max_sharpe',
+                          max_weight: Caps = None) -> BacktestResult:
+    """
+    Re-optimizes monthly over a sliding window of `window` days.
+
+    - objective: 'max_sharpe' (Tangency portfolio) or 'min_variance'.
+    - Between rebalances weights drift with prices (buy-and-hold), so turnover is
+      measured against the drifted weights, as a real portfolio would trade.
+    """
+    if objective not in ('max_sharpe', 'min_variance'):
+        raise ValueError("objective must be 'max_sharpe' or 'min_variance'.")
+    if len(log_returns) <= window:
+        raise ValueError(f"Need more than {window} days of returns for a walk-forward backtest.")
+
+    returns = log_returns.to_numpy(dtype=np.float64)
+    simple_returns = np.expm1(returns)
+    dates = log_returns.index
+    n_days, n_assets = returns.shape
+
+    moments = RollingMoments(n_assets)
+    for t in range(window):
+        moments.add(returns[t])
+
+    # Rebalance on the first trading day of each month
+    months = dates.to_period('M')
+    is_rebalance = np.r_[True, months[1:] != months[:-1]]
+
+    weights = None
+    portfolio_returns = np.full(n_days, np.nan)
+    rebalance_dates, rebalance_weights, turnover = [], [], []
+
+    for t in range(window, n_days):
+        # Moments describe days [t - window, t): only information available before day t
+        if is_rebalance[t] or weights is None:
+            mu = moments.mean * TRADING_DAYS
+            cov = moments.cov * TRADING_DAYS
+            # Warm start from the previous target: monthly windows overlap almost entirely
+            previous = rebalance_weights[-1] if rebalance_weights else None
+            if objective == 'max_sharpe':
+                target = max_sharpe_portfolio(mu, cov, risk_free_rate, max_weight, initial_weights=previous)
+            else:
+                target = min_variance_portfolio(mu, cov, max_weight=max_weight, initial_weights=previous)
+            # First allocation is built from cash: count it as a full one-way turnover
+            traded = np.abs(target - weights).sum() / 2 if weights is not None else 1.0
+            rebalance_dates.append(dates[t])
+            rebalance_weights.append(target)
+            turnover.append(traded)
+            weights = target
+
+        # Hold the portfolio through day t and let the weights drift with prices
+        gross = 1.0 + weights @ simple_returns[t]
+        portfolio_returns[t] = np.log(gross)
+        weights = weights * (1.0 + simple_returns[t]) / gross
+
+        # Slide the window: day t enters, day t - window leaves
+        moments.add(returns[t])
+        moments.remove(returns[t - window])
+
+    realized = portfolio_returns[window:]
+    annual_return = float(realized.mean() * TRADING_DAYS)
+    annual_volatility = float(realized.std(ddof=1) * np.sqrt(TRADING_DAYS))
+    daily = pd.DataFrame({
+        'Portfolio_Return': realized,
+        'Equity': np.exp(np.cumsum(realized)),
+    }, index=dates[window:])
+    turnover_series = pd.Series(turnover, index=pd.Index(rebalance_dates, name=dates.name), name='Turnover')
+
+    return BacktestResult(
+        daily=daily,
+        weights=pd.DataFrame(rebalance_weights, index=turnover_series.index, columns=log_returns.columns),
+        turnover=turnover_series,
+        annual_return=annual_return,
+        annual_volatility=annual_volatility,
+        realized_sharpe=(annual_return - risk_free_rate) / annual_volatility,
+        # The initial allocation from cash is excluded from the average
+        avg_turnover=float(turnover_series.iloc[1:].mean()) if len(turnover_series) > 1 else 0.0,
+    )
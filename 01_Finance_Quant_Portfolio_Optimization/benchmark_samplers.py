@@ -0,0 +1,51 @@
+"""
+Benchmark: convergence of the weight samplers to the exact Max Sharpe portfolio.
+
+For each sampler ('uniform', 'dirichlet', 'sobol') the number of simulated
+portfolios is doubled until the best sampled Sharpe Ratio is within TOLERANCE
+of the exact Tangency portfolio (frontier_solver). Reported as the median
+samples-to-tolerance over several seeds. Uses a synthetic universe (offline).
+
+Run: python benchmark_samplers.py
+"""
+import numpy as np
+
+from benchmark_frontier import RISK_FREE_RATE, synthetic_universe
+from frontier_solver import max_sharpe_portfolio
+from portfolio_engine import SAMPLERS, portfolio_stats, simulate_portfolios
+
+N_ASSETS = 8
+TOLERANCE = 0.05          # Max accepted Sharpe gap to the exact optimum
+MAX_SAMPLES = 2 ** 22
+SEEDS = range(5)
+
+
+def samples_to_tolerance(mean_returns, cov_matrix, target_sharpe: float, sampler: str, seed: int):
+    """Smallest power-of-2 sample size whose best Sharpe is within TOLERANCE (None if never)."""
+    num_portfolios = 2 ** 10
+    while num_portfolios <= MAX_SAMPLES:
+        result = simulate_portfolios(mean_returns, cov_matrix, num_portfolios=num_portfolios,
+                                     risk_free_rate=RISK_FREE_RATE, seed=seed, keep_results=False,
+                                     sampler=sampler)
+        if target_sharpe - result.best_sharpe <= TOLERANCE:
+            return num_portfolios
+        num_portfolios *= 2
+    return None
+
+
+if __name__ == '__main__':
+    mean_returns, cov_matrix = synthetic_universe(N_ASSETS)
+    tangency = max_sharpe_portfolio(mean_returns, cov_matrix, RISK_FREE_RATE)
+    target_sharpe = float(portfolio_stats(tangency[None, :], mean_returns, cov_matrix, RISK_FREE_RATE)[2][0])
+
+    print(f">>> Samples to reach Sharpe gap <= {TOLERANCE} ({N_ASSETS} assets, exact Sharpe {target_sharpe:.4f})")
+    print("------------------------------------------------")
+    print(f"{'Sampler':<12}{'Median samples':>16}{'Worst seed':>14}")
+    for sampler in SAMPLERS:
+        needed = [samples_to_tolerance(mean_returns, cov_matrix, target_sharpe, sampler, seed) for seed in SEEDS]
+        reached = [n for n in needed if n is not None]
+        if len(reached) < len(needed):
+            print(f"{sampler:<12}{'> ' + format(MAX_SAMPLES, ','):>16}{'-':>14}")
+            continue
+        print(f"{sampler:<12}{int(np.median(reached)):>16,}{max(reached):>14,}")
+    print("------------------------------------------------")
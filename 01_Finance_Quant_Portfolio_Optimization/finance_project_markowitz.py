@@ -1,9 +1,16 @@
-import yfinance as yf
+import os
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 
+from portfolio_engine import simulate_portfolios
+from parallel_runner import simulate_sharded
+from frontier_solver import efficient_frontier
+from price_store import PriceStore
+from backtest import walk_forward_backtest
+from frontier_export import export_simulation, simulate_and_export
+
 # ==========================================
 # 1. CONFIGURATION & DATA EXTRACTION
 # ==========================================
@@ -13,19 +20,29 @@ print(">>> Starting Portfolio Optimization Engine...")
 tickers = ['AAPL', 'MSFT', 'GOOGL', 'JPM', 'XOM', 'GLD', 'TSLA', 'AMZN']
 risk_free_rate = 0.04  # Assuming 4% risk-free rate (approx. US Treasury Yield)
 
+# Optimization mode:
+#   'monte_carlo' -> random sampling of portfolios (classic Efficient Frontier cloud)
+#   'exact'       -> deterministic solver (scipy.optimize) for the frontier and Tangency portfolio
+optimization_mode = 'monte_carlo'
+frontier_points = 100   # Target returns on the exact frontier grid
+max_weight = None       # Optional cap per asset in 'exact' mode (e.g. 0.30 = max 30% per asset)
+
+# Walk-forward backtest: re-optimize monthly over a sliding window of past returns
+run_backtest = False
+backtest_window = 252   # Trading days in the estimation window
+
 # Define date range: Historical data for the last 2 years
 end_date = datetime.today()
 start_date = end_date - timedelta(days=365*2)
 
 print(f"Downloading data for: {tickers}...")
 
-# FETCH DATA FIX: 
-# We use 'auto_adjust=True' so Yahoo returns prices already adjusted for splits/dividends.
-# This prevents the 'KeyError: Adj Close' issue.
-raw_data = yf.download(tickers, start=start_date, end=end_date, auto_adjust=True)
-
-# Select only the 'Close' column (which is effectively the Adjusted Close now)
-data = raw_data['Close']
+# FETCH DATA (LOCAL CACHE):
+# Adjusted closes (auto_adjust=True on Yahoo) are cached per ticker in 'price_cache/'.
+# Only date ranges that are not cached yet are downloaded; warm runs read from disk only.
+# Set PRICE_STORE_OFFLINE=1 (and PRICE_STORE_DIR) to run from a recorded dataset.
+price_store = PriceStore(offline=os.environ.get("PRICE_STORE_OFFLINE", "0") == "1")
+data = price_store.get_prices(tickers, start_date, end_date)
 
 # Check for missing values and fill them using forward fill method
 if data.isnull().values.any():
@@ -44,50 +61,102 @@ log_returns = np.log(data / data.shift(1)).dropna()
 # 252 is the standard number of trading days in a year
 cov_matrix = log_returns.cov() * 252
 
-print("Calculating Efficient Frontier via Monte Carlo Simulation...")
-
 # ==========================================
-# 3. MONTE CARLO SIMULATION
+# 3. EFFICIENT FRONTIER (MONTE CARLO OR EXACT)
 # ==========================================
 num_portfolios = 10000
-results = np.zeros((3, num_portfolios))  # Array to store [Return, Volatility, Sharpe Ratio]
-weights_record = []  # List to store weight allocations for each simulation
-
-for i in range(num_portfolios):
-    # Generate random weights for each asset
-    weights = np.random.random(len(tickers))
-    weights /= np.sum(weights)  # Normalize weights so they sum to 1 (100%)
-    weights_record.append(weights)
-    
-    # Calculate Expected Portfolio Return (Annualized)
-    port_return = np.sum(log_returns.mean() * weights) * 252
-    
-    # Calculate Expected Portfolio Volatility (Risk)
-    # Formula: sqrt(w.T * CovMatrix * w)
-    port_volatility = np.sqrt(np.dot(weights.T, np.dot(cov_matrix, weights)))
-    
-    # Calculate Sharpe Ratio (Risk-Adjusted Return)
-    sharpe_ratio = (port_return - risk_free_rate) / port_volatility
-    
-    # Store results
-    results[0, i] = port_return
-    results[1, i] = port_volatility
-    results[2, i] = sharpe_ratio
+chunk_size = 100_000  # Portfolios evaluated per batch (bounds memory for very large runs)
+num_workers = 1       # > 1 runs the simulation in parallel shards (see 'parallel_runner.py')
+frontier_downsample = 1  # With num_workers > 1 or a Parquet export: keep every n-th portfolio for the chart/CSV
+random_seed = None    # Set an integer for reproducible simulations
+# Weight sampler: 'uniform' (original), 'dirichlet' (uniform over the simplex) or
+# 'sobol' (low-discrepancy, reaches the Max Sharpe portfolio with fewer samples)
+sampler = 'uniform'
+
+# Power BI export of the simulated portfolios:
+#   export_format: 'csv' (original) or 'parquet' (float32 columnar file, much smaller)
+#   export_subset: 'all', 'reservoir' (random sample of export_sample_size rows) or 'pareto' (frontier only)
+export_format = 'csv'
+export_subset = 'all'
+export_sample_size = 100_000
+export_weights = False  # Parquet only: add one 'Weight_<TICKER>' column per asset (needs num_workers = 1)
+
+if export_weights and num_workers > 1:
+    raise ValueError("export_weights=True requires num_workers = 1: the sharded runner does not keep weights.")
+
+# Monte Carlo + Parquet (single process): the export is streamed chunk by chunk while simulating,
+# so memory does not grow with num_portfolios (the chart gets every frontier_downsample-th portfolio)
+stream_export = optimization_mode != 'exact' and export_format == 'parquet' and num_workers == 1
+
+# Annualized expected returns per asset (computed once, not per portfolio)
+mean_returns = log_returns.mean() * 252
+
+if optimization_mode == 'exact':
+    print("Calculating Efficient Frontier via Exact Optimization...")
+    # Minimum variance portfolio for each target return + Tangency (Max Sharpe) portfolio
+    simulation = efficient_frontier(
+        mean_returns.values,
+        cov_matrix.values,
+        num_points=frontier_points,
+        risk_free_rate=risk_free_rate,
+        max_weight=max_weight,
+    )
+else:
+    print("Calculating Efficient Frontier via Monte Carlo Simulation...")
+    if num_workers > 1:
+        # Sharded over a process pool; identical output for any number of workers
+        simulation = simulate_sharded(
+            mean_returns.values,
+            cov_matrix.values,
+            num_portfolios=num_portfolios,
+            risk_free_rate=risk_free_rate,
+            seed=random_seed,
+            workers=num_workers,
+            chunk_size=chunk_size,
+            downsample=frontier_downsample,
+            sampler=sampler,
+        )
+    elif stream_export:
+        print("Streaming simulation chunks to Parquet...")
+        exported_rows, simulation = simulate_and_export(
+            'markowitz_simulation.parquet',
+            mean_returns.values,
+            cov_matrix.values,
+            num_portfolios=num_portfolios,
+            risk_free_rate=risk_free_rate,
+            chunk_size=chunk_size,
+            seed=random_seed,
+            sampler=sampler,
+            tickers=tickers if export_weights else None,
+            subset=export_subset,
+            sample_size=export_sample_size,
+            downsample=frontier_downsample,
+        )
+    else:
+        # All weights are drawn as one (N x assets) matrix and evaluated with vectorized
+        # matrix products. See 'portfolio_engine.py' for details.
+        simulation = simulate_portfolios(
+            mean_returns.values,
+            cov_matrix.values,
+            num_portfolios=num_portfolios,
+            risk_free_rate=risk_free_rate,
+            chunk_size=chunk_size,
+            seed=random_seed,
+            sampler=sampler,
+        )
+results = simulation.results  # Array with [Return, Volatility, Sharpe Ratio]
 
 # ==========================================
 # 4. OPTIMIZATION RESULT
 # ==========================================
-# Identify the index of the portfolio with the Maximum Sharpe Ratio
-max_sharpe_idx = np.argmax(results[2])
-
-# Extract stats for the optimal portfolio
-optimal_volatility = results[1, max_sharpe_idx]
-optimal_return = results[0, max_sharpe_idx]
-optimal_sharpe = results[2, max_sharpe_idx]
+# The engine keeps track of the portfolio with the Maximum Sharpe Ratio
+optimal_volatility = simulation.best_volatility
+optimal_return = simulation.best_return
+optimal_sharpe = simulation.best_sharpe
 
 # Create a DataFrame for the optimal weights
 max_sharpe_allocation = pd.DataFrame(
-    weights_record[max_sharpe_idx], 
+    simulation.best_weights, 
     index=tickers, 
     columns=['Allocation']
 )
@@ -111,14 +180,16 @@ plt.figure(figsize=(12, 8))
 
 # Scatter plot of all simulated portfolios
 # X-axis: Risk (Volatility), Y-axis: Return, Color: Sharpe Ratio
-plt.scatter(results[1, :], results[0, :], c=results[2, :], cmap='viridis', marker='o', s=10, alpha=0.5)
-plt.colorbar(label='Sharpe Ratio')
+if results is not None:
+    plt.scatter(results[1, :], results[0, :], c=results[2, :], cmap='viridis', marker='o', s=10, alpha=0.5)
+    plt.colorbar(label='Sharpe Ratio')
 
 # Highlight the Optimal Portfolio (Red Star)
 plt.scatter(optimal_volatility, optimal_return, marker='*', color='red', s=500, label='Max Sharpe Ratio')
 
 # Chart formatting
-plt.title('Markowitz Efficient Frontier (Monte Carlo Simulation)')
+plt.title('Markowitz Efficient Frontier (Exact Optimization)' if optimization_mode == 'exact'
+          else 'Markowitz Efficient Frontier (Monte Carlo Simulation)')
 plt.xlabel('Annualized Volatility (Risk)')
 plt.ylabel('Annualized Return')
 plt.legend(labelspacing=0.8)
@@ -135,19 +206,62 @@ plt.show()
 # ==========================================
 # 6. EXPORT DATA FOR POWER BI
 # ==========================================
-print("\nExporting simulation data to CSV...")
+if stream_export:
+    simulation_file = 'markowitz_simulation.parquet'
+    print(f"\n{exported_rows:,} portfolios exported to Parquet ({export_subset}).")
+elif export_format == 'parquet':
+    print("\nExporting simulation data to Parquet...")
+    rows = export_simulation(
+        'markowitz_simulation.parquet',
+        simulation,
+        tickers=tickers if export_weights else None,
+        subset=export_subset,
+        sample_size=export_sample_size,
+        seed=random_seed,
+    )
+    simulation_file = 'markowitz_simulation.parquet'
+    print(f"{rows:,} portfolios exported ({export_subset}).")
+else:
+    print("\nExporting simulation data to CSV...")
 
-# Create a DataFrame with all simulation results
-portfolio_data = pd.DataFrame({
-    'Volatility': results[1, :],
-    'Return': results[0, :],
-    'Sharpe_Ratio': results[2, :]
-})
+    # Create a DataFrame with all simulation results
+    portfolio_data = pd.DataFrame({
+        'Volatility': results[1, :],
+        'Return': results[0, :],
+        'Sharpe_Ratio': results[2, :]
+    })
 
-# Save to CSV
-portfolio_data.to_csv('markowitz_simulation.csv', index=False)
+    # Save to CSV
+    portfolio_data.to_csv('markowitz_simulation.csv', index=False)
+    simulation_file = 'markowitz_simulation.csv'
 
 # Save the Optimal Weights separately (for the Donut Chart)
 max_sharpe_allocation.to_csv('optimal_weights.csv')
 
-print(">>> Files 'markowitz_simulation.csv' and 'optimal_weights.csv' created successfully.")
\ No newline at end of file
+print(f">>> Files '{simulation_file}' and 'optimal_weights.csv' created successfully.")
+
+# ==========================================
+# 7. WALK-FORWARD BACKTEST (OPTIONAL)
+# ==========================================
+if run_backtest:
+    print(f"\nRunning walk-forward backtest (monthly rebalance, {backtest_window}-day window)...")
+    backtest = walk_forward_backtest(
+        log_returns,
+        window=backtest_window,
+        risk_free_rate=risk_free_rate,
+        max_weight=max_weight,
+    )
+
+    print("------------------------------------------------")
+    print("📅 WALK-FORWARD BACKTEST (Out-of-Sample)")
+    print("------------------------------------------------")
+    print(f"Rebalances:           {len(backtest.turnover)}")
+    print(f"Realized Return:      {backtest.annual_return:.2%}")
+    print(f"Realized Volatility:  {backtest.annual_volatility:.2%}")
+    print(f"Realized Sharpe:      {backtest.realized_sharpe:.2f}")
+    print(f"Avg. Turnover/Month:  {backtest.avg_turnover:.2%}")
+    print("------------------------------------------------")
+
+    backtest_data = backtest.daily.join(backtest.turnover).fillna({'Turnover': 0.0})
+    backtest_data.to_csv('walk_forward_backtest.csv', index_label='Date')
+    print(">>> File 'walk_forward_backtest.csv' created successfully.")
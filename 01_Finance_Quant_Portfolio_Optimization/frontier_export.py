@@ -0,0 +1,200 @@
+"""
+Compact columnar export of Efficient Frontier simulations for Power BI.
+
+Writes Parquet (float32) instead of a CSV row per portfolio, optionally with one
+weight column per asset (`Weight_<TICKER>`). For very large runs the export can be
+reduced to a subset that keeps dashboards small and fast:
+
+    'all'       -> every simulated portfolio (streamed chunk by chunk)
+    'reservoir' -> uniform random sample of `sample_size` portfolios (single pass)
+    'pareto'    -> only the non-dominated portfolios (the Efficient Frontier itself)
+
+All modes consume the (weights, returns, volatility, sharpe) chunks produced by
+`portfolio_engine.iter_portfolio_chunks`, so memory does not grow with the
+simulation size. `simulate_and_export` runs the simulation and the export in
+the same single pass (the full (3, N) results matrix is never built):
+
+    rows, simulation = simulate_and_export('markowitz_simulation.parquet', mu, cov, 50_000_000,
+                                           seed=42, downsample=1_000)
+"""
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from portfolio_engine import DEFAULT_CHUNK_SIZE, SimulationResult, iter_portfolio_chunks
+
+EXPORT_SUBSETS = ('all', 'reservoir', 'pareto')
+Chunk = Tuple[Optional[np.ndarray], np.ndarray, np.ndarray, np.ndarray]
+
+
+def pareto_front(volatility: np.ndarray, returns: np.ndarray) -> np.ndarray:
+    """Indices of portfolios not dominated by another one (lower risk AND higher return)."""
+    # Sort by volatility (ties: highest return first) and keep strict new return highs
+    order = np.lexsort((-returns, volatility))
+    sorted_returns = returns[order]
+    running_max = np.maximum.accumulate(sorted_returns)
+    is_front = np.r_[True, sorted_returns[1:] > running_max[:-1]]
+    return order[is_front]
+
+
+def _to_frame(weights, returns, volatility, sharpe, weight_columns) -> pd.DataFrame:
+    frame = pd.DataFrame({
+        'Volatility': volatility.astype(np.float32),
+        'Return': returns.astype(np.float32),
+        'Sharpe_Ratio': sharpe.astype(np.float32),
+    })
+    if weight_columns:
+        frame[weight_columns] = weights.astype(np.float32)
+    return frame
+
+
+def reservoir_seed(seed: Union[int, np.random.SeedSequence, None]) -> np.random.SeedSequence:
+    """
+    Seed of the reservoir keys: a spawned child of `seed`, so the sampling stream is independent
+    of the simulation stream drawn from `seed` itself (same child on every call).
+    """
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + (0,), pool_size=root.pool_size)
+
+
+def _take(chunk: Chunk, idx: np.ndarray) -> Chunk:
+    weights, returns, volatility, sharpe = chunk
+    return (weights[idx] if weights is not None else None), returns[idx], volatility[idx], sharpe[idx]
+
+
+def _concat(a: Optional[Chunk], b: Chunk) -> Chunk:
+    if a is None:
+        return b
+    weights = np.vstack([a[0], b[0]]) if a[0] is not None else None
+    return (weights, *(np.concatenate([x, y]) for x, y in zip(a[1:], b[1:])))
+
+
+def export_chunks(path: str, chunks: Iterable[Chunk], tickers: Optional[Sequence[str]] = None,
+                  subset: str = 'all', sample_size: int = 100_000,
+                  seed: Union[int, np.random.SeedSequence, None] = None) -> int:
+    """
+    Writes simulation chunks to a Parquet file and returns the number of rows written.
+
+    - tickers: when given, weight columns are included (chunks must carry weights).
+    - subset: 'all', 'reservoir' or 'pareto' (see module docstring).
+    - sample_size / seed: size and seed of the reservoir sample. The keys are drawn from
+      `reservoir_seed(seed)`, so `seed` can be the simulation's own seed.
+    """
+    if subset not in EXPORT_SUBSETS:
+        raise ValueError(f"Unknown subset '{subset}'. Choose one of {EXPORT_SUBSETS}.")
+    weight_columns = [f"Weight_{t}" for t in tickers] if tickers is not None else None
+
+    if subset == 'all':
+        # Stream row groups so the whole simulation never sits in memory
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet export requires 'pyarrow' (pip install pyarrow).") from e
+
+        writer, rows = None, 0
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(_to_frame(*chunk, weight_columns), preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+                rows += table.num_rows
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows
+
+    kept: Optional[Chunk] = None
+    if subset == 'reservoir':
+        # Reservoir sampling via random keys: the `sample_size` smallest keys seen so far
+        # are a uniform sample without replacement of everything streamed
+        rng = np.random.default_rng(reservoir_seed(seed))
+        kept_keys = np.empty(0)
+        for chunk in chunks:
+            kept = _concat(kept, chunk)
+            kept_keys = np.concatenate([kept_keys, rng.random(chunk[1].shape[0])])
+            if kept_keys.shape[0] > sample_size:
+                idx = np.argpartition(kept_keys, sample_size)[:sample_size]
+                kept, kept_keys = _take(kept, idx), kept_keys[idx]
+        if kept is not None:
+            kept = _take(kept, np.argsort(kept_keys))
+    else:
+        # The global front is contained in the union of the per-chunk fronts
+        for chunk in chunks:
+            chunk = _take(chunk, pareto_front(chunk[2], chunk[1]))
+            kept = _concat(kept, chunk)
+            kept = _take(kept, pareto_front(kept[2], kept[1]))
+
+    if kept is None:
+        raise ValueError("No simulation chunks to export.")
+    frame = _to_frame(*kept, weight_columns)
+    frame.to_parquet(path, index=False)
+    return len(frame)
+
+
+def export_simulation(path: str, simulation: SimulationResult, tickers: Optional[Sequence[str]] = None,
+                      subset: str = 'all', sample_size: int = 100_000,
+                      seed: Union[int, np.random.SeedSequence, None] = None) -> int:
+    """Exports an in-memory `SimulationResult` (needs `results`; `weights` if tickers are given)."""
+    if simulation.results is None:
+        raise ValueError("The simulation did not keep its results (keep_results=False).")
+    if tickers is not None and simulation.weights is None:
+        raise ValueError("Weight columns requested but the simulation did not keep weights.")
+    returns, volatility, sharpe = simulation.results
+    chunk = (simulation.weights, returns, volatility, sharpe)
+    return export_chunks(path, [chunk], tickers, subset, sample_size, seed)
+
+
+def simulate_and_export(path: str, mean_returns, cov_matrix, num_portfolios: int, risk_free_rate: float = 0.04,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        seed: Union[int, np.random.SeedSequence, None] = None, sampler: str = 'uniform',
+                        tickers: Optional[Sequence[str]] = None, subset: str = 'all',
+                        sample_size: int = 100_000, downsample: Optional[int] = None
+                        ) -> Tuple[int, SimulationResult]:
+    """
+    Streams `iter_portfolio_chunks` straight into `export_chunks` and tracks the Max Sharpe portfolio
+    on the way. Returns (rows exported, SimulationResult) - the same best portfolio as
+    `simulate_portfolios` with the same seed. `results` holds every `downsample`-th portfolio
+    (for the chart), or None when `downsample` is None.
+    """
+    if num_portfolios <= 0:
+        raise ValueError("num_portfolios must be a positive integer.")
+    if downsample is not None and downsample <= 0:
+        raise ValueError("downsample must be a positive integer.")
+    # The simulation draws from `seed` itself (same stream as simulate_portfolios) and
+    # the reservoir from a spawned child of it (see reservoir_seed)
+    seed = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    rng = np.random.default_rng(seed)
+    best = {'sharpe': -np.inf}
+    samples = []
+
+    def tracked_chunks() -> Iterator[Chunk]:
+        offset = 0
+        for weights, returns, volatility, sharpe in iter_portfolio_chunks(
+                mean_returns, cov_matrix, num_portfolios, risk_free_rate, chunk_size, rng, sampler):
+            idx = int(np.argmax(sharpe))
+            if sharpe[idx] > best['sharpe']:
+                best.update(sharpe=float(sharpe[idx]), weights=weights[idx].copy(), ret=float(returns[idx]),
+                            volatility=float(volatility[idx]), index=offset + idx)
+            if downsample is not None:
+                first = (-offset) % downsample
+                samples.append(np.vstack([returns[first::downsample], volatility[first::downsample],
+                                          sharpe[first::downsample]]))
+            offset += weights.shape[0]
+            yield (weights if tickers is not None else None), returns, volatility, sharpe
+
+    rows = export_chunks(path, tracked_chunks(), tickers, subset, sample_size, seed)
+    if 'weights' not in best:
+        raise ValueError("No finite Sharpe Ratio in the simulation (e.g. zero volatility portfolios).")
+    simulation = SimulationResult(
+        best_weights=best['weights'],
+        best_return=best['ret'],
+        best_volatility=best['volatility'],
+        best_sharpe=best['sharpe'],
+        best_index=best['index'],
+        num_portfolios=num_portfolios,
+        results=np.concatenate(samples, axis=1) if downsample is not None else None,
+    )
+    return rows, simulation
@@ -0,0 +1,215 @@
+"""
+Exact Efficient Frontier solver (deterministic alternative to Monte Carlo sampling).
+
+Solves the constrained mean-variance problem directly with `scipy.optimize`:
+    - Fully invested:  sum(w) = 1
+    - Long-only:       w >= 0
+    - Optional caps:   w <= max_weight (scalar or one value per asset)
+
+Provides the Global Minimum Variance portfolio, the Tangency (Max Sharpe)
+portfolio and a grid of minimum-variance portfolios for target returns.
+"""
+from typing import Optional, Sequence, Union
+
+import numpy as np
+from scipy.optimize import linprog, minimize
+
+from portfolio_engine import SimulationResult, portfolio_stats
+
+Caps = Optional[Union[float, Sequence[float]]]
+
+
+def _bounds(n_assets: int, max_weight: Caps):
+    """Per-asset (lower, upper) bounds, validating that the caps allow a fully invested portfolio."""
+    if max_weight is None:
+        caps = np.ones(n_assets)
+    else:
+        caps = np.broadcast_to(np.asarray(max_weight, dtype=np.float64), (n_assets,)).copy()
+    if np.any(caps <= 0) or caps.sum() < 1 - 1e-12:
+        raise ValueError("Weight caps are infeasible: they must be positive and sum to at least 1.")
+    return [(0.0, float(c)) for c in np.minimum(caps, 1.0)]
+
+
+def _initial_weights(bounds) -> np.ndarray:
+    """Feasible starting point: equal weights clipped to the caps, leftover spread over free assets."""
+    caps = np.array([b[1] for b in bounds])
+    weights = np.minimum(np.full(len(caps), 1.0 / len(caps)), caps)
+    while weights.sum() < 1 - 1e-12:
+        free = weights < caps - 1e-12
+        weights[free] += (1 - weights.sum()) / free.sum()
+        weights = np.minimum(weights, caps)
+    return weights
+
+
+def _solve(objective, mean_returns, bounds, target_return: Optional[float] = None, jac=None,
+           initial_weights: Optional[np.ndarray] = None) -> np.ndarray:
+    constraints = [{'type': 'eq', 'fun': lambda w: np.sum(w) - 1.0, 'jac': lambda w: np.ones_like(w)}]
+    if target_return is not None:
+        constraints.append({'type': 'eq', 'fun': lambda w: w @ mean_returns - target_return,
+                            'jac': lambda w: mean_returns})
+
+    start = _initial_weights(bounds) if initial_weights is None else initial_weights
+    solution = minimize(objective, start, method='SLSQP', bounds=bounds, jac=jac,
+                        constraints=constraints, options={'ftol': 1e-12, 'maxiter': 500})
+    if not solution.success:
+        raise RuntimeError(f"Optimizer failed: {solution.message}")
+    # Clean tiny negative values produced by numerical noise
+    weights = np.clip(solution.x, 0.0, None)
+    return weights / weights.sum()
+
+
+def min_variance_portfolio(mean_returns, cov_matrix, target_return: Optional[float] = None,
+                           max_weight: Caps = None, initial_weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Minimum variance weights, optionally constrained to reach `target_return`.
+    `initial_weights` warm-starts the optimizer (e.g. with the previous rebalance).
+    """
+    mean_returns = np.asarray(mean_returns, dtype=np.float64)
+    cov_matrix = np.asarray(cov_matrix, dtype=np.float64)
+    bounds = _bounds(mean_returns.shape[0], max_weight)
+    return _solve(lambda w: w @ cov_matrix @ w, mean_returns, bounds, target_return,
+                  jac=lambda w: 2 * cov_matrix @ w, initial_weights=initial_weights)
+
+
+def _tangency_active_set(excess: np.ndarray, cov_matrix: np.ndarray,
+                         initial_weights: Optional[np.ndarray] = None, max_iter: int = 1000) -> Optional[np.ndarray]:
+    """
+    Primal active-set solver for the uncapped long-only tangency QP:
+        min y.T * Cov * y   s.t.  excess.T * y = 1,  y >= 0
+    Each iteration solves a small linear system on the free assets, so it is much faster
+    than SLSQP for hundreds of assets (and very fast when warm-started from a previous
+    solution). Returns None if it does not converge.
+    """
+    n = excess.shape[0]
+    y = None
+    if initial_weights is not None:
+        initial_weights = np.clip(np.asarray(initial_weights, dtype=np.float64), 0.0, None)
+        if initial_weights @ excess > 0:
+            y = initial_weights / (initial_weights @ excess)
+    if y is None:
+        y = np.zeros(n)
+        y[np.argmax(excess)] = 1.0 / excess.max()
+    free = y > 0
+
+    for _ in range(max_iter):
+        idx = np.flatnonzero(free)
+        solved = np.linalg.solve(cov_matrix[np.ix_(idx, idx)], excess[idx])
+        candidate = np.zeros(n)
+        candidate[idx] = solved / (excess[idx] @ solved)
+
+        negative = idx[candidate[idx] <= 0]
+        if negative.size:
+            # Ratio test: move towards the candidate until the first free asset hits zero
+            steps = y[negative] / (y[negative] - candidate[negative])
+            k = np.argmin(steps)
+            y = y + steps[k] * (candidate - y)
+            y[negative[k]] = 0.0
+            free[negative[k]] = False
+            continue
+
+        y = candidate
+        # KKT check: gradient 2 * Cov * y = lambda * excess + nu, with nu >= 0 on the bound assets
+        gradient = 2 * cov_matrix @ y
+        lam = 2.0 / (excess[idx] @ solved)
+        nu = gradient - lam * excess
+        nu[free] = 0.0
+        entering = np.argmin(nu)
+        if nu[entering] >= -1e-12 * max(1.0, abs(lam)):
+            return y / y.sum()
+        free[entering] = True
+    return None
+
+
+def max_sharpe_portfolio(mean_returns, cov_matrix, risk_free_rate: float = 0.04,
+                         max_weight: Caps = None, initial_weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Tangency portfolio (maximum Sharpe Ratio).
+
+    When at least one asset beats the risk-free rate, the problem is solved as the
+    equivalent convex QP: min y.T * Cov * y  s.t.  (mu - rf).T * y = 1, y >= 0,
+    y <= cap * sum(y), and then w = y / sum(y) (active-set solver without caps,
+    SLSQP with caps). This is far more robust than
+    maximizing the (non-convex) Sharpe ratio directly, which is only used as a fallback.
+    `initial_weights` warm-starts the optimizer (e.g. with the previous rebalance).
+    """
+    mean_returns = np.asarray(mean_returns, dtype=np.float64)
+    cov_matrix = np.asarray(cov_matrix, dtype=np.float64)
+    bounds = _bounds(mean_returns.shape[0], max_weight)
+    excess = mean_returns - risk_free_rate
+
+    if excess.max() > 0:
+        caps = np.array([b[1] for b in bounds])
+        if np.all(caps >= 1.0):
+            weights = _tangency_active_set(excess, cov_matrix, initial_weights)
+            if weights is not None:
+                return weights
+
+        constraints = [{'type': 'eq', 'fun': lambda y: y @ excess - 1.0, 'jac': lambda y: excess}]
+        if np.any(caps < 1.0):
+            constraints.append({'type': 'ineq', 'fun': lambda y: caps * y.sum() - y,
+                                'jac': lambda y: caps[:, None] * np.ones((len(y), len(y))) - np.eye(len(y))})
+        start = _initial_weights(bounds) if initial_weights is None else np.asarray(initial_weights, dtype=np.float64)
+        start_excess = start @ excess
+        start = start / start_excess if start_excess > 0 else np.eye(len(excess))[np.argmax(excess)] / excess.max()
+
+        solution = minimize(lambda y: y @ cov_matrix @ y, start, method='SLSQP',
+                            jac=lambda y: 2 * cov_matrix @ y, bounds=[(0.0, None)] * len(excess),
+                            constraints=constraints, options={'ftol': 1e-15, 'maxiter': 500})
+        if solution.success:
+            weights = np.clip(solution.x, 0.0, None)
+            return weights / weights.sum()
+
+    def neg_sharpe(w):
+        return -(w @ mean_returns - risk_free_rate) / np.sqrt(w @ cov_matrix @ w)
+
+    def neg_sharpe_grad(w):
+        cov_w = cov_matrix @ w
+        volatility = np.sqrt(w @ cov_w)
+        excess_return = w @ mean_returns - risk_free_rate
+        return -(mean_returns / volatility - excess_return * cov_w / volatility ** 3)
+
+    return _solve(neg_sharpe, mean_returns, bounds, jac=neg_sharpe_grad, initial_weights=initial_weights)
+
+
+def max_return(mean_returns, max_weight: Caps = None) -> float:
+    """Highest achievable return under the constraints (a small linear program)."""
+    mean_returns = np.asarray(mean_returns, dtype=np.float64)
+    bounds = _bounds(mean_returns.shape[0], max_weight)
+    lp = linprog(-mean_returns, A_eq=np.ones((1, mean_returns.shape[0])), b_eq=[1.0], bounds=bounds)
+    return float(-lp.fun)
+
+
+def efficient_frontier(mean_returns, cov_matrix, num_points: int = 50, risk_free_rate: float = 0.04,
+                       max_weight: Caps = None) -> SimulationResult:
+    """
+    Traces the frontier from the Global Minimum Variance portfolio up to the maximum
+    achievable return. Returns a `SimulationResult` (same layout as the Monte Carlo engine)
+    whose `results` rows are the frontier points, sorted by return, and whose `best_*`
+    fields describe the Tangency portfolio. The Tangency portfolio is inserted among the
+    `num_points` frontier points (so there are `num_points + 1`) and `results[:, best_index]`
+    is that portfolio.
+    """
+    mean_returns = np.asarray(mean_returns, dtype=np.float64)
+    cov_matrix = np.asarray(cov_matrix, dtype=np.float64)
+
+    gmv_weights = min_variance_portfolio(mean_returns, cov_matrix, max_weight=max_weight)
+    targets = np.linspace(gmv_weights @ mean_returns, max_return(mean_returns, max_weight), num_points)
+
+    frontier_weights = np.vstack(
+        [gmv_weights] + [min_variance_portfolio(mean_returns, cov_matrix, t, max_weight) for t in targets[1:]]
+    )
+    tangency = max_sharpe_portfolio(mean_returns, cov_matrix, risk_free_rate, max_weight)
+    best_index = int(np.searchsorted(frontier_weights @ mean_returns, tangency @ mean_returns))
+    frontier_weights = np.insert(frontier_weights, best_index, tangency, axis=0)
+    returns, volatility, sharpe = portfolio_stats(frontier_weights, mean_returns, cov_matrix, risk_free_rate)
+
+    return SimulationResult(
+        best_weights=tangency,
+        best_return=float(returns[best_index]),
+        best_volatility=float(volatility[best_index]),
+        best_sharpe=float(sharpe[best_index]),
+        best_index=best_index,
+        num_portfolios=len(frontier_weights),
+        results=np.vstack([returns, volatility, sharpe]),
+        weights=frontier_weights,
+    )
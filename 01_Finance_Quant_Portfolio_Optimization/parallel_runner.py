@@ -0,0 +1,126 @@
+"""
+Multi-core, sharded Monte Carlo runner for the Markowitz simulation.
+
+The simulation is split into fixed-size shards. Each shard gets its own random
+generator spawned from a single `np.random.SeedSequence`, so shards are
+statistically independent and the streams don't depend on which process runs
+them. Because the shard layout depends only on `num_portfolios` and
+`shard_size` (never on the number of workers), results are bit-for-bit
+identical for any worker count.
+
+Several universes / risk-free-rate scenarios can be run in one pool:
+
+    scenarios = [Scenario('base', mu, cov, 0.04), Scenario('high_rates', mu, cov, 0.06)]
+    results = run_scenarios(scenarios, num_portfolios=10_000_000, seed=42, workers=8)
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from portfolio_engine import DEFAULT_CHUNK_SIZE, SimulationResult, simulate_portfolios
+
+DEFAULT_SHARD_SIZE = 1_000_000
+
+
+@dataclass
+class Scenario:
+    """One universe (annualized mean returns + covariance) under one risk-free rate."""
+    name: str
+    mean_returns: np.ndarray
+    cov_matrix: np.ndarray
+    risk_free_rate: float = 0.04
+
+
+def _run_shard(mean_returns, cov_matrix, risk_free_rate, shard_start, shard_portfolios,
+               seed_sequence, chunk_size, downsample, sampler):
+    """Worker: simulates one shard and returns its best portfolio and (optionally) a frontier sample."""
+    result = simulate_portfolios(mean_returns, cov_matrix, num_portfolios=shard_portfolios,
+                                 risk_free_rate=risk_free_rate, chunk_size=chunk_size,
+                                 seed=seed_sequence, keep_results=downsample is not None, sampler=sampler)
+    sample = None
+    if downsample is not None:
+        # Keep portfolios whose *global* index is a multiple of `downsample`
+        first = (-shard_start) % downsample
+        sample = result.results[:, first::downsample]
+        result.results = None
+    result.best_index += shard_start
+    return result, sample
+
+
+def _shard_layout(num_portfolios: int, shard_size: int) -> List[tuple]:
+    starts = range(0, num_portfolios, shard_size)
+    return [(start, min(shard_size, num_portfolios - start)) for start in starts]
+
+
+def _reduce(shard_outputs, num_portfolios: int, downsample: Optional[int]) -> SimulationResult:
+    """Global best-Sharpe portfolio (ties -> lowest index) and concatenated frontier sample."""
+    best = None
+    for result, _ in shard_outputs:
+        if best is None or result.best_sharpe > best.best_sharpe:
+            best = result
+    samples = [sample for _, sample in shard_outputs]
+    return SimulationResult(
+        best_weights=best.best_weights,
+        best_return=best.best_return,
+        best_volatility=best.best_volatility,
+        best_sharpe=best.best_sharpe,
+        best_index=best.best_index,
+        num_portfolios=num_portfolios,
+        results=np.concatenate(samples, axis=1) if downsample is not None else None,
+    )
+
+
+def run_scenarios(scenarios: Sequence[Scenario], num_portfolios: int, seed: Optional[int] = None,
+                  workers: Optional[int] = None, shard_size: int = DEFAULT_SHARD_SIZE,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE, downsample: Optional[int] = None,
+                  sampler: str = 'uniform') -> Dict[str, SimulationResult]:
+    """
+    Runs `num_portfolios` simulations for every scenario, sharded over a process pool.
+
+    - seed: root seed. Scenario i / shard j always uses child seed [i][j].
+    - workers: number of processes (default: all cores; 1 runs everything in-process).
+    - downsample: keep every n-th portfolio (global index) in `results` for the frontier chart;
+      None keeps only the best portfolio, so memory does not grow with `num_portfolios`.
+    - sampler: weight sampler of `portfolio_engine` ('uniform', 'dirichlet' or 'sobol').
+    """
+    if num_portfolios <= 0 or shard_size <= 0:
+        raise ValueError("num_portfolios and shard_size must be positive integers.")
+    if downsample is not None and downsample <= 0:
+        raise ValueError("downsample must be a positive integer.")
+
+    layout = _shard_layout(num_portfolios, shard_size)
+    scenario_seeds = np.random.SeedSequence(seed).spawn(len(scenarios))
+
+    tasks = []
+    for scenario, scenario_seed in zip(scenarios, scenario_seeds):
+        shard_seeds = scenario_seed.spawn(len(layout))
+        for (start, size), shard_seed in zip(layout, shard_seeds):
+            tasks.append((scenario.mean_returns, scenario.cov_matrix, scenario.risk_free_rate,
+                          start, size, shard_seed, chunk_size, downsample, sampler))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        outputs = [_run_shard(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() returns results in submission order, so the reduction is deterministic
+            outputs = list(pool.map(_run_shard, *zip(*tasks)))
+
+    results = {}
+    for i, scenario in enumerate(scenarios):
+        shard_outputs = outputs[i * len(layout):(i + 1) * len(layout)]
+        results[scenario.name] = _reduce(shard_outputs, num_portfolios, downsample)
+    return results
+
+
+def simulate_sharded(mean_returns, cov_matrix, num_portfolios: int = 10000, risk_free_rate: float = 0.04,
+                     seed: Optional[int] = None, workers: Optional[int] = None,
+                     shard_size: int = DEFAULT_SHARD_SIZE, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     downsample: Optional[int] = None, sampler: str = 'uniform') -> SimulationResult:
+    """Single-scenario shortcut for `run_scenarios`."""
+    scenario = Scenario('default', np.asarray(mean_returns), np.asarray(cov_matrix), risk_free_rate)
+    return run_scenarios([scenario], num_portfolios, seed, workers, shard_size, chunk_size,
+                         downsample, sampler)['default']
@@ -0,0 +1,176 @@
+"""
+Vectorized Monte Carlo engine for the Markowitz Efficient Frontier.
+
+Instead of building one portfolio per Python loop iteration, weights are drawn
+as an (N x assets) matrix and the whole batch is evaluated with a couple of
+BLAS calls:
+
+    returns     = W @ mu
+    volatility  = sqrt(rowwise(W @ Cov * W))     (quadratic form w.T * Cov * w)
+    sharpe      = (returns - rf) / volatility
+
+Simulations are processed in chunks of `chunk_size` rows so that memory stays
+bounded even for tens of millions of portfolios.
+
+Weight samplers ('sampler' argument):
+    'uniform'   -> U(0,1) per asset, normalized (original scheme; crowds the center of the simplex)
+    'dirichlet' -> Dirichlet(1,...,1): uniform over the whole weight simplex, corners included
+    'sobol'     -> scrambled Sobol low-discrepancy points mapped onto the simplex
+"""
+import warnings
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+from scipy.stats import qmc
+
+TRADING_DAYS = 252
+DEFAULT_CHUNK_SIZE = 100_000
+SAMPLERS = ('uniform', 'dirichlet', 'sobol')
+
+
+@dataclass
+class SimulationResult:
+    """Output of a Monte Carlo run."""
+    best_weights: np.ndarray           # Weights of the Max Sharpe portfolio
+    best_return: float
+    best_volatility: float
+    best_sharpe: float
+    best_index: int                    # Position of the best portfolio in the simulation
+    num_portfolios: int
+    results: Optional[np.ndarray] = None  # (3, N) -> [Return, Volatility, Sharpe Ratio]
+    weights: Optional[np.ndarray] = None  # (N, assets), only if keep_weights=True
+
+
+def uniform_weights(rng: np.random.Generator, n: int, n_assets: int) -> np.ndarray:
+    """Random weights normalized so each row sums to 1 (same scheme as the original loop)."""
+    weights = rng.random((n, n_assets))
+    weights /= weights.sum(axis=1, keepdims=True)
+    return weights
+
+
+def dirichlet_weights(rng: np.random.Generator, n: int, n_assets: int) -> np.ndarray:
+    """Flat Dirichlet draw: every point of the weight simplex is equally likely."""
+    return rng.dirichlet(np.ones(n_assets), size=n)
+
+
+def _simplex_from_unit_cube(u: np.ndarray) -> np.ndarray:
+    """Maps points of the unit cube onto the simplex (normalized exponential spacings = flat Dirichlet)."""
+    spacings = -np.log(np.clip(u, np.finfo(np.float64).tiny, 1.0))
+    return spacings / spacings.sum(axis=1, keepdims=True)
+
+
+def make_sampler(sampler: str, rng: np.random.Generator, n_assets: int) -> Callable[[int], np.ndarray]:
+    """Returns a function n -> (n x assets) weight matrix for the chosen sampler."""
+    if sampler == 'uniform':
+        return lambda n: uniform_weights(rng, n, n_assets)
+    if sampler == 'dirichlet':
+        return lambda n: dirichlet_weights(rng, n, n_assets)
+    if sampler == 'sobol':
+        # One engine per run, so consecutive chunks continue the same low-discrepancy sequence
+        engine = qmc.Sobol(d=n_assets, scramble=True, seed=rng)
+
+        def sobol_weights(n: int) -> np.ndarray:
+            with warnings.catch_warnings():
+                # Chunk sizes are rarely powers of 2; the sequence stays low-discrepancy anyway
+                warnings.simplefilter('ignore', UserWarning)
+                return _simplex_from_unit_cube(engine.random(n))
+        return sobol_weights
+    raise ValueError(f"Unknown sampler '{sampler}'. Choose one of {SAMPLERS}.")
+
+
+def portfolio_stats(weights: np.ndarray, mean_returns: np.ndarray, cov_matrix: np.ndarray,
+                    risk_free_rate: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Annualized return, volatility and Sharpe Ratio for every row of `weights`.
+    `mean_returns` and `cov_matrix` must already be annualized.
+    """
+    port_returns = weights @ mean_returns
+    # Row-wise quadratic form: one matrix product + an element-wise reduction
+    port_variance = np.einsum('ij,ij->i', weights @ cov_matrix, weights)
+    port_volatility = np.sqrt(port_variance)
+    sharpe_ratios = (port_returns - risk_free_rate) / port_volatility
+    return port_returns, port_volatility, sharpe_ratios
+
+
+def iter_portfolio_chunks(mean_returns, cov_matrix, num_portfolios: int, risk_free_rate: float = 0.04,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE,
+                          rng: Optional[np.random.Generator] = None, sampler: str = 'uniform'
+                          ) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Yields (weights, returns, volatility, sharpe) for consecutive chunks of the simulation.
+    Peak memory is proportional to `chunk_size`, not to `num_portfolios`.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    rng = rng if rng is not None else np.random.default_rng()
+    mean_returns = np.asarray(mean_returns, dtype=np.float64)
+    cov_matrix = np.asarray(cov_matrix, dtype=np.float64)
+    draw_weights = make_sampler(sampler, rng, mean_returns.shape[0])
+
+    remaining = num_portfolios
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        weights = draw_weights(n)
+        port_returns, port_volatility, sharpe_ratios = portfolio_stats(
+            weights, mean_returns, cov_matrix, risk_free_rate)
+        yield weights, port_returns, port_volatility, sharpe_ratios
+        remaining -= n
+
+
+def simulate_portfolios(mean_returns, cov_matrix, num_portfolios: int = 10000, risk_free_rate: float = 0.04,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        seed: Union[int, np.random.SeedSequence, None] = None,
+                        keep_results: bool = True, keep_weights: bool = False,
+                        sampler: str = 'uniform') -> SimulationResult:
+    """
+    Runs the Monte Carlo simulation and tracks the Max Sharpe portfolio.
+
+    - keep_results: store the (3, N) [Return, Volatility, Sharpe] matrix (needed for the chart/CSV).
+    - keep_weights: also store every weight vector (N x assets). Disable for very large runs.
+    With both flags off, memory usage only depends on `chunk_size`.
+    - sampler: 'uniform', 'dirichlet' or 'sobol' (see module docstring).
+    """
+    if num_portfolios <= 0:
+        raise ValueError("num_portfolios must be a positive integer.")
+    rng = np.random.default_rng(seed)
+    mean_returns = np.asarray(mean_returns, dtype=np.float64)
+    n_assets = mean_returns.shape[0]
+
+    results = np.empty((3, num_portfolios)) if keep_results else None
+    all_weights = np.empty((num_portfolios, n_assets)) if keep_weights else None
+
+    best_sharpe = -np.inf
+    best = None
+    offset = 0
+    for weights, port_returns, port_volatility, sharpe_ratios in iter_portfolio_chunks(
+            mean_returns, cov_matrix, num_portfolios, risk_free_rate, chunk_size, rng, sampler):
+        n = weights.shape[0]
+        if keep_results:
+            results[0, offset:offset + n] = port_returns
+            results[1, offset:offset + n] = port_volatility
+            results[2, offset:offset + n] = sharpe_ratios
+        if keep_weights:
+            all_weights[offset:offset + n] = weights
+
+        idx = int(np.argmax(sharpe_ratios))
+        if sharpe_ratios[idx] > best_sharpe:
+            best_sharpe = float(sharpe_ratios[idx])
+            best = (weights[idx].copy(), float(port_returns[idx]), float(port_volatility[idx]), offset + idx)
+        offset += n
+
+    if best is None:
+        raise ValueError("No finite Sharpe Ratio in the simulation (e.g. zero volatility portfolios).")
+
+    best_weights, best_return, best_volatility, best_index = best
+    return SimulationResult(
+        best_weights=best_weights,
+        best_return=best_return,
+        best_volatility=best_volatility,
+        best_sharpe=best_sharpe,
+        best_index=best_index,
+        num_portfolios=num_portfolios,
+        results=results,
+        weights=all_weights,
+    )
@@ -0,0 +1,168 @@
+"""
+Local on-disk price cache for Yahoo Finance downloads.
+
+Adjusted closes are stored in one Parquet file per ticker (`<TICKER>.parquet`),
+plus a small `coverage.json` with the date range already requested for each
+ticker (weekends/holidays have no rows, so the data alone can't tell what was
+already fetched).
+
+    store = PriceStore("price_cache")
+    prices = store.get_prices(['AAPL', 'MSFT'], start, end)   # only missing ranges are downloaded
+
+Offline mode never touches the network and reads only from disk, so a fixture
+directory with recorded data can be used for tests or air-gapped runs:
+
+    store = PriceStore("fixtures/prices", offline=True)
+"""
+import json
+import os
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+DEFAULT_CACHE_DIR = os.environ.get("PRICE_STORE_DIR", "price_cache")
+COVERAGE_FILE = "coverage.json"
+
+# downloader(tickers, start, end) -> DataFrame of adjusted closes (DatetimeIndex, one column per ticker)
+Downloader = Callable[[List[str], pd.Timestamp, pd.Timestamp], pd.DataFrame]
+
+
+def yahoo_downloader(tickers: List[str], start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """Default downloader: adjusted closes from Yahoo Finance ('end' is exclusive)."""
+    import yfinance as yf  # Imported lazily so offline runs don't need it
+
+    raw_data = yf.download(tickers, start=start, end=end, auto_adjust=True, progress=False)
+    if raw_data.empty:
+        return pd.DataFrame()
+    closes = raw_data['Close']
+    if isinstance(closes, pd.Series):
+        closes = closes.to_frame(tickers[0])
+    return closes
+
+
+class PriceStore:
+    """Columnar, per-ticker cache of adjusted close prices."""
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, offline: bool = False,
+                 downloader: Optional[Downloader] = None):
+        self.cache_dir = cache_dir
+        self.offline = offline
+        self.downloader = downloader or yahoo_downloader
+        self.downloads = 0  # Number of downloader calls (useful to check warm runs)
+        if not offline:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    # ------------------------------------------
+    # Disk I/O
+    # ------------------------------------------
+    def _path(self, ticker: str) -> str:
+        return os.path.join(self.cache_dir, f"{ticker}.parquet")
+
+    def _load_coverage(self) -> Dict[str, Tuple[pd.Timestamp, pd.Timestamp]]:
+        path = os.path.join(self.cache_dir, COVERAGE_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            raw = json.load(f)
+        return {t: (pd.Timestamp(s), pd.Timestamp(e)) for t, (s, e) in raw.items()}
+
+    def _save_coverage(self, coverage: Dict[str, Tuple[pd.Timestamp, pd.Timestamp]]):
+        raw = {t: [s.strftime('%Y-%m-%d'), e.strftime('%Y-%m-%d')] for t, (s, e) in coverage.items()}
+        with open(os.path.join(self.cache_dir, COVERAGE_FILE), "w") as f:
+            json.dump(raw, f, indent=2, sort_keys=True)
+
+    def load(self, ticker: str) -> pd.Series:
+        """All cached closes for one ticker (empty Series if not cached)."""
+        path = self._path(ticker)
+        if not os.path.exists(path):
+            return pd.Series(dtype='float64', name=ticker)
+        series = pd.read_parquet(path)['Close']
+        series.name = ticker
+        return series
+
+    def _save(self, ticker: str, series: pd.Series):
+        frame = series.rename('Close').to_frame()
+        frame.index.name = 'Date'
+        frame.to_parquet(self._path(ticker))
+
+    # ------------------------------------------
+    # Public API
+    # ------------------------------------------
+    def get_prices(self, tickers: Sequence[str], start, end) -> pd.DataFrame:
+        """
+        Adjusted closes for `tickers` in [start, end). Downloads only the date ranges
+        that are not cached yet; in offline mode only the local files are used.
+        """
+        start = pd.Timestamp(start).normalize()
+        end = pd.Timestamp(end).normalize()
+        if end <= start:
+            raise ValueError("'end' must be after 'start'.")
+
+        if not self.offline:
+            self._fetch_missing(list(tickers), start, end)
+
+        columns = {}
+        for ticker in tickers:
+            series = self.load(ticker)
+            if series.empty:
+                raise FileNotFoundError(f"No cached prices for '{ticker}' in '{self.cache_dir}'.")
+            columns[ticker] = series[(series.index >= start) & (series.index < end)]
+        return pd.DataFrame(columns)
+
+    def _fetch_missing(self, tickers: List[str], start: pd.Timestamp, end: pd.Timestamp):
+        coverage = self._load_coverage()
+        today = pd.Timestamp(datetime.today()).normalize()
+
+        # Group tickers by missing range so a cold run is a single download call
+        missing = defaultdict(list)
+        for ticker in tickers:
+            if ticker not in coverage:
+                missing[(start, end)].append(ticker)
+                continue
+            covered_start, covered_end = coverage[ticker]
+            if start < covered_start:
+                missing[(start, covered_start)].append(ticker)
+            if end > covered_end:
+                missing[(covered_end, end)].append(ticker)
+
+        for (gap_start, gap_end), group in missing.items():
+            self.downloads += 1
+            fetched = self.downloader(group, gap_start, gap_end)
+            for ticker in group:
+                new_data = fetched[ticker].dropna() if ticker in fetched else pd.Series(dtype='float64')
+                cached = self.load(ticker)
+                merged = pd.concat([cached, new_data]) if not cached.empty else new_data
+                merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+                if not merged.empty:
+                    self._save(ticker, merged)
+
+                # Never mark future days as covered: they must be fetched once they exist
+                recorded_end = min(gap_end, today)
+                covered_start, covered_end = coverage.get(ticker, (gap_start, recorded_end))
+                coverage[ticker] = (min(covered_start, gap_start), max(covered_end, recorded_end))
+
+        if missing:
+            self._save_coverage(coverage)
+
+
+def get_prices(tickers: Sequence[str], start, end, cache_dir: str = DEFAULT_CACHE_DIR,
+               offline: Optional[bool] = None) -> pd.DataFrame:
+    """
+    Convenience wrapper. `offline` defaults to the PRICE_STORE_OFFLINE environment variable
+    (set it to 1 to run from a fixture directory without network access).
+    """
+    if offline is None:
+        offline = os.environ.get("PRICE_STORE_OFFLINE", "0") == "1"
+    return PriceStore(cache_dir, offline=offline).get_prices(tickers, start, end)
+
+
+if __name__ == '__main__':
+    # Small demo: warm the cache for the default universe
+    demo_tickers = ['AAPL', 'MSFT', 'GOOGL', 'JPM', 'XOM', 'GLD', 'TSLA', 'AMZN']
+    demo_end = pd.Timestamp(datetime.today())
+    store = PriceStore()
+    prices = store.get_prices(demo_tickers, demo_end - pd.Timedelta(days=365 * 2), demo_end)
+    print(f">>> {prices.shape[0]} rows cached for {len(demo_tickers)} tickers "
+          f"({store.downloads} download call(s)) in '{store.cache_dir}'.")
@@ -0,0 +1,41 @@
+"""Input and edge-case tests of the Monte Carlo engine and the exact frontier (run: python -m pytest)."""
+import numpy as np
+import pytest
+
+from frontier_solver import efficient_frontier, max_sharpe_portfolio
+from portfolio_engine import simulate_portfolios
+
+MEAN_RETURNS = np.array([0.08, 0.12, 0.10])
+COV_MATRIX = np.diag([0.04, 0.09, 0.0625])
+
+
+def test_best_portfolio_matches_stored_results():
+    result = simulate_portfolios(MEAN_RETURNS, COV_MATRIX, num_portfolios=1_000, chunk_size=300, seed=0)
+
+    assert result.best_index == int(np.argmax(result.results[2]))
+    assert result.best_sharpe == pytest.approx(result.results[2].max())
+    assert result.best_weights.sum() == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize('num_portfolios', [0, -5])
+def test_non_positive_num_portfolios_raises(num_portfolios):
+    with pytest.raises(ValueError, match='num_portfolios must be a positive integer'):
+        simulate_portfolios(MEAN_RETURNS, COV_MATRIX, num_portfolios=num_portfolios, seed=0)
+
+
+@pytest.mark.filterwarnings('ignore:invalid value encountered:RuntimeWarning')
+def test_all_nan_sharpe_raises_distinct_error():
+    # Zero volatility and zero excess return: every Sharpe Ratio is 0 / 0
+    with pytest.raises(ValueError, match='No finite Sharpe Ratio'):
+        simulate_portfolios(np.zeros(3), np.zeros((3, 3)), num_portfolios=100, risk_free_rate=0.0, seed=0)
+
+
+def test_exact_frontier_best_index_is_the_tangency_portfolio():
+    result = efficient_frontier(MEAN_RETURNS, COV_MATRIX, num_points=20)
+    tangency = max_sharpe_portfolio(MEAN_RETURNS, COV_MATRIX)
+
+    assert result.results.shape == (3, 21) and result.num_portfolios == 21
+    np.testing.assert_allclose(result.weights[result.best_index], tangency)
+    assert result.results[2, result.best_index] == pytest.approx(result.best_sharpe)
+    assert result.best_sharpe >= result.results[2].max() - 1e-9
+    assert np.all(np.diff(result.results[0]) >= -1e-12)
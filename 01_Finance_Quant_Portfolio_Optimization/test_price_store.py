@@ -0,0 +1,54 @@
+"""Offline tests of the price cache against the recorded fixture in fixtures/prices (run: python -m pytest)."""
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from price_store import PriceStore
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'prices')
+
+
+def no_network(tickers, start, end):
+    raise AssertionError(f"Unexpected download of {tickers} [{start.date()}, {end.date()}).")
+
+
+def test_offline_store_reads_fixture():
+    store = PriceStore(FIXTURE_DIR, offline=True, downloader=no_network)
+    prices = store.get_prices(['AAPL', 'MSFT'], '2024-01-01', '2024-02-01')
+
+    assert list(prices.columns) == ['AAPL', 'MSFT']
+    assert isinstance(prices.index, pd.DatetimeIndex)
+    assert len(prices) == 22
+    assert prices.index[0] == pd.Timestamp('2024-01-02') and prices.index[-1] == pd.Timestamp('2024-01-31')
+    assert not prices.isna().any().any()
+    assert prices.loc['2024-01-02', 'MSFT'] == pytest.approx(365.3104)
+    assert prices.loc['2024-01-31', 'AAPL'] == pytest.approx(169.9402)
+    assert store.downloads == 0
+
+
+def test_offline_store_slices_end_exclusive():
+    prices = PriceStore(FIXTURE_DIR, offline=True, downloader=no_network).get_prices(
+        ['MSFT'], '2024-01-16', '2024-01-19')
+
+    assert list(prices.index.strftime('%Y-%m-%d')) == ['2024-01-16', '2024-01-17', '2024-01-18']
+    assert prices['MSFT'].tolist() == pytest.approx([344.7660, 341.9774, 345.6054])
+
+
+def test_offline_store_raises_for_uncached_ticker():
+    with pytest.raises(FileNotFoundError):
+        PriceStore(FIXTURE_DIR, offline=True, downloader=no_network).get_prices(['TSLA'], '2024-01-01', '2024-02-01')
+
+
+def test_covered_range_is_served_from_cache(tmp_path):
+    # Online store over a copy of the fixture: coverage.json already spans the request
+    cache_dir = str(tmp_path / 'prices')
+    shutil.copytree(FIXTURE_DIR, cache_dir)
+    store = PriceStore(cache_dir, downloader=no_network)
+    prices = store.get_prices(['AAPL', 'MSFT'], '2024-01-08', '2024-01-13')
+
+    assert store.downloads == 0
+    assert len(prices) == 5
+    pd.testing.assert_frame_equal(
+        prices, PriceStore(FIXTURE_DIR, offline=True).get_prices(['AAPL', 'MSFT'], '2024-01-08', '2024-01-13'))
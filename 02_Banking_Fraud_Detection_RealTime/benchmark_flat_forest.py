@@ -0,0 +1,66 @@
+"""
+Benchmark: sklearn RandomForest vs. flattened array-based inference (flat_forest.py).
+
+Trains the fraud model on synthetic transactions, checks that both give the same
+probabilities, then measures single-transaction latency, micro-batch latency and
+bulk throughput. (For large offline batches sklearn's compiled predictor stays the
+better choice; the flat forest targets per-request scoring.)
+
+Run: python benchmark_flat_forest.py
+"""
+import time
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+from flat_forest import export_forest
+from fraud_data_generator import FEATURES, generate_transactions
+
+N_SINGLE_ROWS = 200
+N_BATCH_ROWS = 200_000
+
+
+def per_call_ms(score, rows) -> float:
+    """Median latency (ms) of scoring one row per call."""
+    timings = []
+    for row in rows:
+        started = time.perf_counter()
+        score(row)
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings) * 1000)
+
+
+if __name__ == '__main__':
+    print(">>> Training fraud model (100 trees)...")
+    train = generate_transactions(50_000, np.random.default_rng(42))
+    rf = RandomForestClassifier(n_estimators=100, class_weight='balanced', random_state=42)
+    rf.fit(train[FEATURES].values, train['Class'])
+    forest = export_forest(rf)
+
+    scoring = generate_transactions(N_BATCH_ROWS, np.random.default_rng(7))[FEATURES].values
+    max_diff = np.abs(rf.predict_proba(scoring) - forest.predict_proba(scoring)).max()
+    print(f"Max |sklearn - flat| probability difference: {max_diff:.2e}")
+
+    single_rows = [scoring[i:i + 1] for i in range(N_SINGLE_ROWS)]
+    sklearn_ms = per_call_ms(rf.predict_proba, single_rows)
+    flat_ms = per_call_ms(forest.predict_proba, single_rows)
+
+    micro_batches = [scoring[i:i + 256] for i in range(0, 256 * N_SINGLE_ROWS // 4, 256)]
+    sklearn_micro_ms = per_call_ms(rf.predict_proba, micro_batches)
+    flat_micro_ms = per_call_ms(forest.predict_proba, micro_batches)
+
+    started = time.perf_counter()
+    rf.predict_proba(scoring)
+    sklearn_batch = time.perf_counter() - started
+    started = time.perf_counter()
+    forest.predict_proba(scoring)
+    flat_batch = time.perf_counter() - started
+
+    print("------------------------------------------------")
+    print(f"{'':<22}{'sklearn':>12}{'flat':>12}{'speed-up':>10}")
+    print(f"{'Single row (ms)':<22}{sklearn_ms:>12.3f}{flat_ms:>12.3f}{sklearn_ms / flat_ms:>9.1f}x")
+    print(f"{'Batch of 256 (ms)':<22}{sklearn_micro_ms:>12.3f}{flat_micro_ms:>12.3f}"
+          f"{sklearn_micro_ms / flat_micro_ms:>9.1f}x")
+    print(f"{f'Bulk {N_BATCH_ROWS:,} (rows/s)':<22}{N_BATCH_ROWS / sklearn_batch:>12,.0f}{N_BATCH_ROWS / flat_batch:>12,.0f}"
+          f"{sklearn_batch / flat_batch:>9.1f}x")
+    print("------------------------------------------------")
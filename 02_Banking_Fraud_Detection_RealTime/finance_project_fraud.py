@@ -7,6 +7,9 @@ from sklearn.ensemble import RandomForestClassifier, IsolationForest
 from sklearn.metrics import classification_report, confusion_matrix, precision_recall_curve, auc
 from sklearn.preprocessing import StandardScaler
 
+from fraud_data_generator import generate_transactions
+from fraud_pipeline import export_scored_chunks, score_transactions
+
 # ==========================================
 # CONFIGURATION
 # ==========================================
@@ -15,61 +18,28 @@ OUTPUT_DIR = "outputs_finance_fraud"
 if not os.path.exists(OUTPUT_DIR):
     os.makedirs(OUTPUT_DIR)
 
+# Pipeline mode: after training, generate/score/write the export in chunks as a
+# partitioned Parquet dataset instead of one in-memory DataFrame + CSV
+PIPELINE_MODE = False
+EXPORT_TRANSACTIONS = 100_000_000
+EXPORT_CHUNK_SIZE = 1_000_000
+
 print(">>> Starting Finance Project 2: Credit Card Fraud Detection...")
 
 # ==========================================
 # 1. GENERATE SYNTHETIC TRANSACTION DATA
 # ==========================================
-print(f"[{datetime.now().strftime('%H:%M:%S')}] Generating 50,000 transactions (Imbalanced)...")
-
-n_transactions = 50000
+n_transactions = 50000  # Scale knob: the vectorized generator handles tens of millions of rows
 fraud_rate = 0.005  # 0.5% fraud rate (Very realistic)
 
-# Simulate Time (Seconds since midnight)
-# Legitimate transactions happen mostly during day, Frauds spread out or late night
-time_data = np.random.randint(0, 86400, n_transactions)
-
-# Simulate Amount (Log-normal distribution)
-# Most transactions are small ($10-$100), outliers are huge
-amount_data = np.random.lognormal(mean=3.5, sigma=1.0, size=n_transactions)
-
-# Simulate "Anonymized Features" (V1, V2...) typically found in bank datasets (PCA components)
-# We generate random noise
-V1 = np.random.normal(0, 1, n_transactions)
-V2 = np.random.normal(0, 1, n_transactions)
-V3 = np.random.normal(0, 1, n_transactions)
-
-df = pd.DataFrame({
-    'Transaction_ID': [f"TRX_{i+1:06d}" for i in range(n_transactions)],
-    'Time_Seconds': time_data,
-    'Amount': amount_data.round(2),
-    'V1': V1, 'V2': V2, 'V3': V3
-})
-
-# INJECT FRAUD LOGIC
-# Fraudsters tend to make:
-# 1. Very high amounts OR very small testing amounts
-# 2. Transactions at weird times (3 AM)
-# 3. Specific patterns in V features (simulating card operational data)
-
-def inject_fraud(row):
-    # Base probability
-    prob = 0.0
-    
-    # Rule 1: High Amount Anomaly
-    if row['Amount'] > 500: prob += 0.3
-    
-    # Rule 2: Late night (00:00 to 05:00)
-    if row['Time_Seconds'] < 18000: prob += 0.2
-    
-    # Rule 3: Specific "V" pattern (simulating geo-location mismatch)
-    if row['V1'] < -2: prob += 0.4
-    
-    # Inject randomly based on calculated risk, but keep total rate low
-    is_fraud = 1 if (np.random.rand() < prob) and (np.random.rand() < 0.05) else 0
-    return is_fraud
-
-df['Class'] = df.apply(inject_fraud, axis=1)
+print(f"[{datetime.now().strftime('%H:%M:%S')}] Generating {n_transactions:,} transactions (Imbalanced)...")
+
+# Transactions are simulated in 'fraud_data_generator.py':
+# - Time (seconds since midnight), Amount (log-normal), anonymized V1-V3 features (PCA-like)
+# - INJECT FRAUD LOGIC as vectorized rules. Fraudsters tend to make:
+#   1. Very high amounts, 2. Transactions at weird times (3 AM),
+#   3. Specific patterns in V features (simulating card operational data)
+df = generate_transactions(n_transactions, rng=np.random.default_rng(42))
 
 print(f"Total Transactions: {n_transactions}")
 print(f"Total Frauds: {df['Class'].sum()} ({df['Class'].mean():.2%})")
@@ -91,8 +61,8 @@ X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_
 iso_forest = IsolationForest(contamination=fraud_rate, random_state=42)
 iso_forest.fit(X_train)
 # Isolation Forest predicts -1 for anomaly, 1 for normal. We map -1 to 1 (Fraud)
-y_pred_iso = iso_forest.predict(X_test)
-y_pred_iso = [1 if x == -1 else 0 for x in y_pred_iso]
+# (For continuous traffic, see 'streaming_anomaly.py': chunked scoring + background refits)
+y_pred_iso = np.where(iso_forest.predict(X_test) == -1, 1, 0)
 
 # MODEL 2: Random Forest with Class Weighting (Supervised)
 # 'class_weight="balanced"' penalizes mistakes on the minority class more
@@ -123,17 +93,19 @@ print(f"False Alarms (FP): {fp} (Customer Friction)")
 # ==========================================
 print(f"[{datetime.now().strftime('%H:%M:%S')}] Exporting data for Power BI...")
 
-# Run model on full dataset for visualization
-df['Fraud_Probability'] = rf.predict_proba(X)[:, 1]
-df['Predicted_Class'] = np.where(df['Fraud_Probability'] > 0.5, 'Fraud Alert', 'Legitimate')
-
-# Logic: Flag High-Risk for manual review
-# If probability is 0.3 to 0.5, it's "Suspicious"
-df['Status'] = np.where(df['Fraud_Probability'] > 0.8, 'Auto-Block',
-               np.where(df['Fraud_Probability'] > 0.4, 'Manual Review', 'Approved'))
-
-# Calculate "Saved Money" (Assuming we blocked the frauds)
-df['Potential_Loss_Saved'] = np.where((df['Class']==1) & (df['Status']!='Approved'), df['Amount'], 0)
-
-df.to_csv(f"{OUTPUT_DIR}/fraud_detection_powerbi.csv", index=False)
-print(f"\n>>> DONE! Files saved in '{OUTPUT_DIR}'.")
\ No newline at end of file
+if PIPELINE_MODE:
+    # Generate -> score -> write one chunk at a time (constant memory at any dataset size)
+    export_dir = f"{OUTPUT_DIR}/fraud_detection_powerbi"
+    print(f"Pipeline mode: scoring {EXPORT_TRANSACTIONS:,} transactions in chunks of {EXPORT_CHUNK_SIZE:,}...")
+    totals = export_scored_chunks(rf, EXPORT_TRANSACTIONS, export_dir, chunk_size=EXPORT_CHUNK_SIZE)
+    print(f"Rows: {totals['rows']:,} | Frauds: {totals['frauds']:,} | Auto-Blocked: {totals['auto_blocked']:,} "
+          f"| Loss Saved: ${totals['loss_saved']:,.2f} | {totals['rows'] / totals['elapsed_s']:,.0f} rows/s")
+    print(f"\n>>> DONE! Partitioned Parquet dataset saved in '{export_dir}'.")
+else:
+    # Run model on full dataset for visualization
+    # Adds Fraud_Probability, Predicted_Class, Status (Auto-Block > 0.8, Manual Review > 0.4)
+    # and Potential_Loss_Saved (assuming we blocked the frauds). See 'fraud_pipeline.py'.
+    df = score_transactions(df, rf)
+
+    df.to_csv(f"{OUTPUT_DIR}/fraud_detection_powerbi.csv", index=False)
+    print(f"\n>>> DONE! Files saved in '{OUTPUT_DIR}'.")
@@ -0,0 +1,132 @@
+"""
+Flattened, array-based inference for fitted tree ensembles.
+
+`sklearn`'s `predict_proba` has a high fixed cost per call (input validation,
+joblib dispatch over trees), which dominates when scoring one transaction at a
+time. `export_forest` turns a fitted `RandomForestClassifier` (the fraud,
+booking-cancellation and IoT-failure models all use one) into a few contiguous
+NumPy arrays:
+
+    feature[node], threshold[node], left[node], right[node], value[node, class]
+
+All trees are concatenated and scored together with a vectorized traversal:
+each step advances every (row, tree) pair one level at once, and pairs that
+have reached a leaf drop out of the active set.
+
+The exported arrays can be saved to a `.npz` file and scored without sklearn:
+
+    forest = export_forest(rf); forest.save("fraud_rf.npz")
+    forest = FlatForest.load("fraud_rf.npz")
+    forest.predict_proba(X)        # matches rf.predict_proba(X) within float tolerance
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+DEFAULT_BATCH_SIZE = 10_000
+
+
+@dataclass
+class FlatForest:
+    """All trees of a forest stored as flat node arrays."""
+    feature: np.ndarray     # (nodes,) int32, feature index tested at each node (0 on leaves)
+    threshold: np.ndarray   # (nodes,) float64, go left if x[feature] <= threshold
+    left: np.ndarray        # (nodes,) int32, global index of the left child (self on leaves)
+    right: np.ndarray       # (nodes,) int32, global index of the right child (self on leaves)
+    value: np.ndarray       # (nodes, n_classes) float64, class probabilities at each leaf
+    roots: np.ndarray       # (n_trees,) int32, global index of each tree's root
+    max_depth: int
+    n_features: int
+    classes: np.ndarray
+
+    def __post_init__(self):
+        self.is_leaf = self.left == np.arange(self.left.shape[0])
+
+    def apply(self, X: np.ndarray) -> np.ndarray:
+        """Leaf index reached in every tree: (rows, n_trees)."""
+        n_rows, n_trees = X.shape[0], self.roots.shape[0]
+        nodes = np.tile(self.roots, n_rows)
+        rows = np.repeat(np.arange(n_rows), n_trees)
+
+        # Only (row, tree) pairs that have not reached a leaf yet take another step
+        active = np.flatnonzero(~self.is_leaf[nodes])
+        while active.size:
+            current = nodes[active]
+            go_left = X[rows[active], self.feature[current]] <= self.threshold[current]
+            current = np.where(go_left, self.left[current], self.right[current])
+            nodes[active] = current
+            active = active[~self.is_leaf[current]]
+        return nodes.reshape(n_rows, n_trees)
+
+    def predict_proba(self, X, batch_size: int = DEFAULT_BATCH_SIZE) -> np.ndarray:
+        """Mean of the per-tree leaf probabilities (same as sklearn's RandomForest)."""
+        # sklearn compares float32 features against the thresholds, so do the same
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X[None, :]
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} features, got {X.shape[1]}.")
+
+        proba = np.empty((X.shape[0], self.value.shape[1]))
+        for start in range(0, X.shape[0], batch_size):
+            leaves = self.apply(X[start:start + batch_size])
+            proba[start:start + batch_size] = self.value[leaves].mean(axis=1)
+        return proba
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes[np.argmax(self.predict_proba(X), axis=1)]
+
+    def save(self, path: str):
+        np.savez(path, feature=self.feature, threshold=self.threshold, left=self.left, right=self.right,
+                 value=self.value, roots=self.roots, max_depth=self.max_depth,
+                 n_features=self.n_features, classes=self.classes)
+
+    @classmethod
+    def load(cls, path: str) -> 'FlatForest':
+        with np.load(path, allow_pickle=False) as data:
+            return cls(feature=data['feature'], threshold=data['threshold'], left=data['left'],
+                       right=data['right'], value=data['value'], roots=data['roots'],
+                       max_depth=int(data['max_depth']), n_features=int(data['n_features']),
+                       classes=data['classes'])
+
+
+def export_forest(model) -> FlatForest:
+    """Flattens a fitted sklearn forest classifier (single output) into a `FlatForest`."""
+    estimators = getattr(model, 'estimators_', None)
+    if not estimators:
+        raise ValueError("The model must be a fitted tree ensemble (e.g. RandomForestClassifier).")
+    if getattr(model, 'n_outputs_', 1) != 1:
+        raise ValueError("Only single-output forests are supported.")
+
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset, max_depth = 0, 0
+    for estimator in estimators:
+        tree = estimator.tree_
+        n_nodes = tree.node_count
+        node_ids = np.arange(n_nodes)
+        is_leaf = tree.children_left == -1
+
+        features.append(np.where(is_leaf, 0, tree.feature))
+        thresholds.append(np.where(is_leaf, 0.0, tree.threshold))
+        lefts.append(np.where(is_leaf, node_ids, tree.children_left) + offset)
+        rights.append(np.where(is_leaf, node_ids, tree.children_right) + offset)
+        # Depending on the sklearn version leaves hold counts or fractions: normalize both
+        leaf_values = tree.value[:, 0, :]
+        values.append(leaf_values / leaf_values.sum(axis=1, keepdims=True))
+        roots.append(offset)
+
+        offset += n_nodes
+        max_depth = max(max_depth, tree.max_depth)
+
+    return FlatForest(
+        feature=np.concatenate(features).astype(np.int32),
+        threshold=np.concatenate(thresholds).astype(np.float64),
+        left=np.concatenate(lefts).astype(np.int32),
+        right=np.concatenate(rights).astype(np.int32),
+        value=np.concatenate(values).astype(np.float64),
+        roots=np.array(roots, dtype=np.int32),
+        max_depth=int(max_depth),
+        n_features=int(model.n_features_in_),
+        # Object labels (strings) are stored as fixed-width text so the .npz loads without pickle
+        classes=np.asarray(model.classes_).astype(str) if model.classes_.dtype == object else model.classes_,
+    )
@@ -0,0 +1,127 @@
+"""In-process tests of the micro-batching fraud scoring service (run: python -m pytest)."""
+import queue
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from fraud_data_generator import FEATURES, generate_transactions
+from fraud_scoring_service import MicroBatchScorer, serve_queue
+
+
+class RecordingModel:
+    """Stand-in model: probabilities spread over [0, 0.99], records the size of every batch."""
+
+    def __init__(self):
+        self.batch_sizes = []
+        self.lock = threading.Lock()
+
+    def predict_proba(self, frame):
+        with self.lock:
+            self.batch_sizes.append(len(frame))
+        probability = np.linspace(0.0, 0.99, len(frame))
+        return np.column_stack([1 - probability, probability])
+
+
+class FailingModel:
+    def predict_proba(self, frame):
+        raise ValueError("model unavailable")
+
+
+def run_serve_queue(scorer, transactions):
+    """Fills a queue with `transactions` and the None sentinel, serves it; returns (results, error)."""
+    source = queue.Queue()
+    for transaction in transactions:
+        source.put(transaction)
+    source.put(None)
+    results, errors = [], []
+
+    def consume():
+        try:
+            serve_queue(scorer, source, results.append)
+        except Exception as e:
+            errors.append(e)
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    consumer.join(timeout=5)
+    assert not consumer.is_alive(), "serve_queue did not return after the sentinel"
+    return results, (errors[0] if errors else None)
+
+
+@pytest.fixture
+def transactions():
+    return generate_transactions(32, np.random.default_rng(0))[['Transaction_ID'] + FEATURES].to_dict('records')
+
+
+def test_futures_resolve_to_probability_and_status(transactions):
+    model = RecordingModel()
+    with MicroBatchScorer(model, max_batch_size=8, max_wait_ms=5) as scorer:
+        results = [future.result(timeout=5) for future in [scorer.submit(t) for t in transactions]]
+
+    assert len(results) == len(transactions)
+    for transaction, result in zip(transactions, results):
+        assert result['Transaction_ID'] == transaction['Transaction_ID']
+        assert 0.0 <= result['Fraud_Probability'] <= 1.0
+        assert result['Status'] in {'Auto-Block', 'Manual Review', 'Approved'}
+    assert sum(model.batch_sizes) == len(transactions)
+
+
+def test_batches_flush_at_size_limit(transactions):
+    model = RecordingModel()
+    # The deadline is a minute away: only a full batch can trigger a flush
+    with MicroBatchScorer(model, max_batch_size=4, max_wait_ms=60_000) as scorer:
+        started = time.perf_counter()
+        futures = [scorer.submit(t) for t in transactions[:8]]
+        for future in futures:
+            future.result(timeout=5)
+        elapsed = time.perf_counter() - started
+
+    assert model.batch_sizes == [4, 4]
+    assert elapsed < 5
+
+
+def test_batches_flush_at_timeout(transactions):
+    model = RecordingModel()
+    max_wait_ms = 100
+    # The batch can never fill up: only the deadline can trigger a flush
+    with MicroBatchScorer(model, max_batch_size=1_000, max_wait_ms=max_wait_ms) as scorer:
+        started = time.perf_counter()
+        futures = [scorer.submit(t) for t in transactions[:3]]
+        for future in futures:
+            future.result(timeout=5)
+        elapsed = time.perf_counter() - started
+
+    assert model.batch_sizes == [3]
+    assert elapsed >= max_wait_ms / 1000 * 0.9
+
+
+def test_submit_after_stop_raises(transactions):
+    scorer = MicroBatchScorer(RecordingModel()).start()
+    scorer.stop()
+    with pytest.raises(RuntimeError):
+        scorer.submit(transactions[0])
+
+
+def test_submit_before_start_raises(transactions):
+    with pytest.raises(RuntimeError):
+        MicroBatchScorer(RecordingModel()).submit(transactions[0])
+
+
+def test_serve_queue_delivers_one_result_per_transaction(transactions):
+    with MicroBatchScorer(RecordingModel(), max_batch_size=8, max_wait_ms=5) as scorer:
+        results, error = run_serve_queue(scorer, transactions)
+
+    assert error is None
+    assert sorted(r['Transaction_ID'] for r in results) == sorted(t['Transaction_ID'] for t in transactions)
+
+
+def test_serve_queue_raises_when_the_model_fails(transactions):
+    with MicroBatchScorer(FailingModel(), max_batch_size=8, max_wait_ms=5) as scorer:
+        results, error = run_serve_queue(scorer, transactions)
+
+    assert results == []
+    assert isinstance(error, RuntimeError)
+    assert f"{len(transactions)} transaction(s)" in str(error)
+    assert isinstance(error.__cause__, ValueError)
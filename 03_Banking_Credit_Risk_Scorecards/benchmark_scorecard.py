@@ -0,0 +1,83 @@
+"""
+Benchmark: sklearn Pipeline vs. compiled points scorecard (scorecard.py).
+
+Trains the credit scorecard pipeline on synthetic applicants, compiles it into a
+points table, checks how closely the scorecard reproduces the pipeline's
+Credit_Score and Decision, then measures single-applicant latency (loan
+origination API) and bulk throughput.
+
+Run: python benchmark_scorecard.py
+"""
+import time
+
+import numpy as np
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+from credit_data_generator import generate_applicants
+from scorecard import APPROVAL_CUTOFF, MAX_SCORE, MIN_SCORE, compile_scorecard
+
+NUMERIC_FEATURES = ['Age', 'Annual_Income', 'Years_Employed', 'Loan_Amount', 'Interest_Rate', 'DTI_Ratio',
+                    'Credit_History_Length_Years']
+CATEGORICAL_FEATURES = ['Home_Ownership', 'Loan_Purpose', 'Previous_Defaults']
+FEATURES = NUMERIC_FEATURES + CATEGORICAL_FEATURES
+
+N_SINGLE_ROWS = 500
+N_BULK_ROWS = 1_000_000
+
+
+def per_call_ms(score, rows) -> float:
+    """Median latency (ms) of scoring one applicant per call."""
+    timings = []
+    for row in rows:
+        started = time.perf_counter()
+        score(row)
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings) * 1000)
+
+
+def pipeline_credit_score(clf, X) -> np.ndarray:
+    """Credit_Score exactly as computed in 'finance_project_credit_risk.py'."""
+    return (MIN_SCORE + (1 - clf.predict_proba(X)[:, 1]) * (MAX_SCORE - MIN_SCORE)).astype(int)
+
+
+if __name__ == '__main__':
+    print(">>> Training credit scorecard pipeline...")
+    train = generate_applicants(50_000, np.random.default_rng(42))
+    preprocessor = ColumnTransformer(transformers=[
+        ('num', StandardScaler(), NUMERIC_FEATURES),
+        ('cat', OneHotEncoder(handle_unknown='ignore'), CATEGORICAL_FEATURES)])
+    clf = Pipeline(steps=[('preprocessor', preprocessor),
+                          ('classifier', LogisticRegression(class_weight='balanced', random_state=42))])
+    clf.fit(train[FEATURES], train['Default_On_File'])
+    card = compile_scorecard(clf, train[FEATURES])
+    print(f"Compiled scorecard: {len(card.points_table())} buckets over {len(card.features)} features")
+
+    applicants = generate_applicants(N_BULK_ROWS, np.random.default_rng(7))[FEATURES]
+    exact_scores = pipeline_credit_score(clf, applicants)
+    card_scores = card.score(applicants)['Credit_Score'].values
+    score_diff = np.abs(exact_scores - card_scores)
+    decision_match = np.mean((exact_scores >= APPROVAL_CUTOFF) == (card_scores >= APPROVAL_CUTOFF))
+    print(f"|Pipeline - scorecard| Credit_Score: mean {score_diff.mean():.2f}, "
+          f"p99 {np.percentile(score_diff, 99):.0f} points | Decision agreement: {decision_match:.2%}")
+
+    single_frames = [applicants.iloc[i:i + 1] for i in range(N_SINGLE_ROWS)]
+    single_dicts = applicants.iloc[:N_SINGLE_ROWS].to_dict('records')
+    pipeline_ms = per_call_ms(clf.predict_proba, single_frames)
+    card_ms = per_call_ms(card.score_applicant, single_dicts)
+
+    started = time.perf_counter()
+    pipeline_credit_score(clf, applicants)
+    pipeline_bulk = time.perf_counter() - started
+    started = time.perf_counter()
+    card.score(applicants)
+    card_bulk = time.perf_counter() - started
+
+    print("------------------------------------------------")
+    print(f"{'':<24}{'pipeline':>12}{'scorecard':>12}{'speed-up':>10}")
+    print(f"{'Single applicant (ms)':<24}{pipeline_ms:>12.4f}{card_ms:>12.4f}{pipeline_ms / card_ms:>9.0f}x")
+    print(f"{f'Bulk {N_BULK_ROWS:,} (rows/s)':<24}{N_BULK_ROWS / pipeline_bulk:>12,.0f}"
+          f"{N_BULK_ROWS / card_bulk:>12,.0f}{pipeline_bulk / card_bulk:>9.1f}x")
+    print("------------------------------------------------")
@@ -0,0 +1,91 @@
+"""
+Vectorized synthetic loan-applicant generator for the credit risk scorecard.
+
+The default target is simulated with array operations instead of a row-wise
+`DataFrame.apply`: the risk score is built from boolean masks, mapped through
+the same sigmoid, and the default flag comes from one batched random draw:
+
+    score = 2.5*PrevDefault + 2.0*(DTI > 0.40) + 0.5*RENT + 1.0*(YearsEmployed < 2)
+            + 0.5*(Age < 25) + 1.0*(Income < 30k)
+    PD    = 1 / (1 + exp(-(score - 3)))
+    Default_On_File = U(0,1) < PD
+
+Portfolio-sized books (tens of millions of clients) are emitted in chunks:
+`iter_applicant_chunks(n_clients=20_000_000, chunk_size=1_000_000)`.
+"""
+import time
+from typing import Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+HOME_OWNERSHIP = ['RENT', 'MORTGAGE', 'OWN']
+LOAN_PURPOSES = ['EDUCATION', 'MEDICAL', 'VENTURE', 'PERSONAL', 'DEBT_CONSOLIDATION']
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+def client_ids(start: int, n: int) -> np.ndarray:
+    """'CL_00001'-style IDs for rows start+1 .. start+n."""
+    numbers = np.arange(start + 1, start + n + 1).astype(str)
+    return np.char.add('CL_', np.char.zfill(numbers, 5))
+
+
+def default_probability(df: pd.DataFrame) -> np.ndarray:
+    """Sigmoid of the rule-based risk score: High DTI, Previous Defaults, Low Income, Renting -> Higher Risk."""
+    score = (2.5 * (df['Previous_Defaults'].values == 1)
+             + 2.0 * (df['DTI_Ratio'].values > 0.40)  # High debt burden
+             + 0.5 * (df['Home_Ownership'].values == 'RENT')
+             + 1.0 * (df['Years_Employed'].values < 2)
+             + 0.5 * (df['Age'].values < 25)
+             + 1.0 * (df['Annual_Income'].values < 30000))
+    return 1 / (1 + np.exp(-(score - 3)))  # Shift to adjust default rate
+
+
+def generate_applicants(n_clients: int, rng: Optional[np.random.Generator] = None,
+                        start_id: int = 0) -> pd.DataFrame:
+    """One batch of loan applications with engineered DTI and the simulated 'Default_On_File' target."""
+    rng = rng if rng is not None else np.random.default_rng(42)
+
+    df = pd.DataFrame({
+        'Client_ID': client_ids(start_id, n_clients),
+        'Age': rng.integers(21, 75, n_clients),
+        'Annual_Income': rng.lognormal(mean=10.5, sigma=0.6, size=n_clients).round(-2),  # Lognormal is realistic for income
+        'Years_Employed': rng.integers(0, 20, n_clients),
+        'Home_Ownership': rng.choice(HOME_OWNERSHIP, n_clients, p=[0.4, 0.4, 0.2]),
+        'Loan_Amount': rng.integers(1000, 35000, n_clients),
+        'Loan_Purpose': rng.choice(LOAN_PURPOSES, n_clients),
+        'Interest_Rate': rng.uniform(5.0, 20.0, n_clients).round(2),
+        'Credit_History_Length_Years': rng.integers(1, 30, n_clients),
+        'Previous_Defaults': rng.choice([0, 1], n_clients, p=[0.85, 0.15]),  # 15% had a default before
+    })
+
+    # Feature Engineering: Debt-to-Income Ratio (DTI) - CRITICAL for Finance
+    # Calculating monthly income vs monthly loan payment (simplified)
+    df['Monthly_Income'] = df['Annual_Income'] / 12
+    df['Estimated_Monthly_Payment'] = (df['Loan_Amount'] * (1 + (df['Interest_Rate'] / 100))) / 24  # Assuming 2 year loan
+    df['DTI_Ratio'] = df['Estimated_Monthly_Payment'] / df['Monthly_Income']
+
+    df['Default_On_File'] = (rng.random(n_clients) < default_probability(df)).astype(np.int64)
+    return df
+
+
+def iter_applicant_chunks(n_clients: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                          seed: Optional[int] = 42) -> Iterator[pd.DataFrame]:
+    """Yields the applicant book in DataFrames of at most `chunk_size` rows (IDs continue across chunks)."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_clients, chunk_size):
+        yield generate_applicants(min(chunk_size, n_clients - start), rng, start_id=start)
+
+
+if __name__ == '__main__':
+    # Stress-test demo: stream a portfolio-sized book and report throughput
+    n_rows = 10_000_000
+    started = time.perf_counter()
+    n_defaults = 0
+    for chunk in iter_applicant_chunks(n_rows):
+        n_defaults += int(chunk['Default_On_File'].sum())
+    elapsed = time.perf_counter() - started
+    print(f">>> Generated {n_rows:,} applicants in {elapsed:.1f}s "
+          f"({n_rows / elapsed:,.0f} rows/s). Default rate: {n_defaults / n_rows:.2%}")
@@ -9,11 +9,27 @@ from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 from sklearn.metrics import classification_report, roc_auc_score, roc_curve
 
+from credit_data_generator import generate_applicants
+from incremental_scoring import IncrementalScorer
+from portfolio_loss import simulate_portfolio_losses
+from scorecard import compile_scorecard
+
 # ==========================================
 # CONFIGURATION
 # ==========================================
 np.random.seed(42)
 OUTPUT_DIR = "outputs_finance_risk"
+
+# Portfolio credit VaR (one-factor Gaussian copula, see 'portfolio_loss.py')
+LOSS_SCENARIOS = 20_000
+ASSET_CORRELATION = 0.15
+CONFIDENCE_LEVELS = [0.95, 0.99, 0.999]
+
+# Incremental re-scoring (opt-in): cache PD / Credit_Score by (feature vector, model version) hash
+# and only run the model on new or changed applicants (see 'incremental_scoring.py').
+# Pays off on large books re-scored daily; at the default 10k rows it only adds overhead.
+INCREMENTAL_SCORING = False
+SCORE_CACHE_DIR = "score_cache"
 if not os.path.exists(OUTPUT_DIR):
     os.makedirs(OUTPUT_DIR)
 
@@ -24,46 +40,14 @@ print(">>> Starting Finance Project 1: Credit Risk Scoring Model...")
 # ==========================================
 print(f"[{datetime.now().strftime('%H:%M:%S')}] Generating loan application data...")
 
-n_clients = 10000
-
-# Generating base features
-data = {
-    'Client_ID': [f"CL_{i+1:05d}" for i in range(n_clients)],
-    'Age': np.random.randint(21, 75, n_clients),
-    'Annual_Income': np.random.lognormal(mean=10.5, sigma=0.6, size=n_clients).round(-2), # Lognormal is realistic for income
-    'Years_Employed': np.random.randint(0, 20, n_clients),
-    'Home_Ownership': np.random.choice(['RENT', 'MORTGAGE', 'OWN'], n_clients, p=[0.4, 0.4, 0.2]),
-    'Loan_Amount': np.random.randint(1000, 35000, n_clients),
-    'Loan_Purpose': np.random.choice(['EDUCATION', 'MEDICAL', 'VENTURE', 'PERSONAL', 'DEBT_CONSOLIDATION'], n_clients),
-    'Interest_Rate': np.random.uniform(5.0, 20.0, n_clients).round(2),
-    'Credit_History_Length_Years': np.random.randint(1, 30, n_clients),
-    'Previous_Defaults': np.random.choice([0, 1], n_clients, p=[0.85, 0.15]) # 15% had a default before
-}
-
-df = pd.DataFrame(data)
-
-# Feature Engineering: Debt-to-Income Ratio (DTI) - CRITICAL for Finance
-# Calculating monthly income vs monthly loan payment (simplified)
-df['Monthly_Income'] = df['Annual_Income'] / 12
-df['Estimated_Monthly_Payment'] = (df['Loan_Amount'] * (1 + (df['Interest_Rate']/100))) / 24 # Assuming 2 year loan
-df['DTI_Ratio'] = df['Estimated_Monthly_Payment'] / df['Monthly_Income']
-
-# Logic to Simulate TARGET (Default = 1)
-# High DTI, Previous Defaults, Low Income, Renting -> Higher Risk
-def simulate_default(row):
-    score = 0
-    if row['Previous_Defaults'] == 1: score += 2.5
-    if row['DTI_Ratio'] > 0.40: score += 2.0  # High debt burden
-    if row['Home_Ownership'] == 'RENT': score += 0.5
-    if row['Years_Employed'] < 2: score += 1.0
-    if row['Age'] < 25: score += 0.5
-    if row['Annual_Income'] < 30000: score += 1.0
-    
-    # Sigmoid-like probability
-    prob = 1 / (1 + np.exp(-(score - 3))) # Shift to adjust default rate
-    return 1 if np.random.rand() < prob else 0
-
-df['Default_On_File'] = df.apply(simulate_default, axis=1)
+n_clients = 10000  # Scale knob: use iter_applicant_chunks() for portfolio-sized books (tens of millions)
+
+# Applications are simulated in 'credit_data_generator.py':
+# - Base features (Age, lognormal Income, Employment, Home Ownership, Loan terms, Previous Defaults)
+# - Feature Engineering: Debt-to-Income Ratio (DTI) - CRITICAL for Finance
+# - TARGET (Default = 1) as a vectorized risk score + sigmoid:
+#   High DTI, Previous Defaults, Low Income, Renting -> Higher Risk
+df = generate_applicants(n_clients, rng=np.random.default_rng(42))
 
 print(f"Default Rate in Dataset: {df['Default_On_File'].mean():.2%}")
 df.to_csv(f"{OUTPUT_DIR}/raw_loan_data.csv", index=False)
@@ -102,26 +86,41 @@ roc = roc_auc_score(y_test, y_pred_proba)
 print("\n--- Model Performance ---")
 print(f"ROC-AUC Score: {roc:.3f} (Industry standard > 0.7)")
 
+# Compiled points table for the loan origination API: one additive contribution per
+# feature bucket, scored with lookups and sums only (see 'scorecard.py')
+scorecard = compile_scorecard(clf, X_train)
+scorecard.save(f"{OUTPUT_DIR}/credit_scorecard.json")
+scorecard.points_table().to_csv(f"{OUTPUT_DIR}/scorecard_points_table.csv", index=False)
+
 # ==========================================
 # 3. CREATE CREDIT SCORE (SCALING)
 # ==========================================
 print(f"[{datetime.now().strftime('%H:%M:%S')}] Calculating Credit Scores (300-850)...")
 
-# Apply model to full dataset
-df['PD'] = clf.predict_proba(X)[:, 1] # Probability of Default
-
 # Scaling Logic: Convert PD to a Score (like FICO)
 # Formula: Score = Offset - (Factor * ln(Odds))
 # Simplified mapping: Low PD -> High Score (850), High PD -> Low Score (300)
 min_score = 300
 max_score = 850
 
-# Invert probability (Probability of Paying)
-df['Prob_Non_Default'] = 1 - df['PD']
-
-# Linear mapping for simplicity in this demo (In real life, we use Log Odds)
-df['Credit_Score'] = min_score + (df['Prob_Non_Default'] * (max_score - min_score))
-df['Credit_Score'] = df['Credit_Score'].astype(int)
+# Apply model to full dataset
+if INCREMENTAL_SCORING:
+    # The cache stores PD and the Credit_Score of the same linear mapping as below
+    scores, cache_stats = IncrementalScorer(clf, SCORE_CACHE_DIR).score(X)
+    df['PD'] = scores['PD'] # Probability of Default
+    df['Prob_Non_Default'] = 1 - df['PD']
+    df['Credit_Score'] = scores['Credit_Score'].astype(int)
+    print(f"Score cache: hit rate {cache_stats['hit_rate']:.1%} | re-scored {cache_stats['rescored']:,} rows | "
+          f"time saved ~{cache_stats['time_saved_s']:.2f}s")
+else:
+    df['PD'] = clf.predict_proba(X)[:, 1] # Probability of Default
+
+    # Invert probability (Probability of Paying)
+    df['Prob_Non_Default'] = 1 - df['PD']
+
+    # Linear mapping for simplicity in this demo (In real life, we use Log Odds)
+    df['Credit_Score'] = min_score + (df['Prob_Non_Default'] * (max_score - min_score))
+    df['Credit_Score'] = df['Credit_Score'].astype(int)
 
 # Create Tiers
 df['Risk_Rating'] = pd.cut(df['Credit_Score'], 
@@ -140,6 +139,16 @@ df['LGD'] = 0.60
 df['EAD'] = df['Loan_Amount']
 df['Expected_Loss'] = df['PD'] * df['LGD'] * df['EAD']
 
+# Portfolio View: EL per loan ignores default clustering in a downturn.
+# Simulate correlated defaults of the whole book -> Loss distribution, VaR and Expected Shortfall
+print(f"[{datetime.now().strftime('%H:%M:%S')}] Simulating portfolio loss distribution ({LOSS_SCENARIOS:,} scenarios)...")
+loss_distribution = simulate_portfolio_losses(df['PD'].values, df['LGD'].values, df['EAD'].values,
+                                              n_scenarios=LOSS_SCENARIOS, rho=ASSET_CORRELATION, seed=42)
+loss_summary = loss_distribution.summary(CONFIDENCE_LEVELS)
+print(loss_summary.to_string(index=False, float_format='{:,.0f}'.format,
+                             formatters={'Confidence': '{:.1%}'.format}))
+loss_summary.to_csv(f"{OUTPUT_DIR}/portfolio_credit_var.csv", index=False)
+
 # Export for Power BI
 cols_export = ['Client_ID', 'Annual_Income', 'Loan_Amount', 'Loan_Purpose', 
                'DTI_Ratio', 'Default_On_File', 'PD', 'Credit_Score', 
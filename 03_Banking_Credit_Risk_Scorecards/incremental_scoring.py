@@ -0,0 +1,173 @@
+"""
+Incremental (cached) re-scoring of the credit book.
+
+The nightly run re-scores every client with `clf.predict_proba(X)`, although
+most applicants' features have not changed since the last run. Here each row's
+feature vector is hashed together with the model version (vectorized
+`pd.util.hash_pandas_object` keyed by the model fingerprint), and PD / Credit_Score
+are kept in a persistent cache:
+
+    score_cache/scores.parquet    Feature_Hash (uint64), PD, Credit_Score
+    score_cache/cache_meta.json   model version + measured model cost per row (for 'time saved')
+
+Only new or changed rows go through the model; a new model version produces
+different hashes, so stale scores can never be served.
+
+    scorer = IncrementalScorer(clf, "score_cache")
+    scores, stats = scorer.score(df[features])   # stats: hit rate, rows re-scored, time saved
+"""
+import hashlib
+import json
+import os
+import pickle
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from scorecard import MAX_SCORE, MIN_SCORE
+
+DEFAULT_CACHE_DIR = "score_cache"
+SCORES_FILE = "scores.parquet"
+META_FILE = "cache_meta.json"
+
+
+def model_fingerprint(model) -> str:
+    """Stable version id of a fitted model (hash of its pickled state)."""
+    return hashlib.sha256(pickle.dumps(model)).hexdigest()[:16]
+
+
+def feature_hashes(X: pd.DataFrame, model_version: str) -> np.ndarray:
+    """One uint64 per row, hashing all feature values together with the model version."""
+    hash_key = hashlib.sha256(model_version.encode()).hexdigest()[:16]  # hash_pandas_object wants 16 chars
+    # Categoricals hash each distinct label once (same hash values as the raw strings)
+    text_columns = [c for c in X.columns if not pd.api.types.is_numeric_dtype(X[c])
+                    and not isinstance(X[c].dtype, pd.CategoricalDtype)]
+    if text_columns:
+        X = X.astype({c: 'category' for c in text_columns})
+    return pd.util.hash_pandas_object(X, index=False, hash_key=hash_key).to_numpy()
+
+
+def credit_score(probability_of_default: np.ndarray) -> np.ndarray:
+    """Same linear PD -> 300-850 mapping as 'finance_project_credit_risk.py'."""
+    return (MIN_SCORE + (1 - probability_of_default) * (MAX_SCORE - MIN_SCORE)).astype(np.int64)
+
+
+class IncrementalScorer:
+    """Scores a book through a persistent feature-hash -> (PD, Credit_Score) cache."""
+
+    def __init__(self, model, cache_dir: str = DEFAULT_CACHE_DIR, model_version: Optional[str] = None,
+                 features: Optional[Sequence[str]] = None):
+        self.model = model
+        self.cache_dir = cache_dir
+        self.model_version = model_version or model_fingerprint(model)
+        self.features = list(features) if features is not None else None
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # ------------------------------------------
+    # Disk I/O
+    # ------------------------------------------
+    def _load_meta(self) -> Dict:
+        path = os.path.join(self.cache_dir, META_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def _load_cache(self, meta: Dict) -> pd.DataFrame:
+        path = os.path.join(self.cache_dir, SCORES_FILE)
+        if meta.get('model_version') != self.model_version or not os.path.exists(path):
+            return pd.DataFrame({'Feature_Hash': np.empty(0, dtype=np.uint64), 'PD': np.empty(0),
+                                 'Credit_Score': np.empty(0, dtype=np.int64)})
+        return pd.read_parquet(path)
+
+    def _save(self, cache: pd.DataFrame, seconds_per_row: Optional[float], measured_rows: int):
+        cache.to_parquet(os.path.join(self.cache_dir, SCORES_FILE), index=False)
+        with open(os.path.join(self.cache_dir, META_FILE), "w") as f:
+            json.dump({'model_version': self.model_version, 'rows': len(cache),
+                       'seconds_per_row': seconds_per_row, 'measured_rows': int(measured_rows)}, f, indent=2)
+
+    # ------------------------------------------
+    # Scoring
+    # ------------------------------------------
+    def score(self, X: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
+        """
+        PD and Credit_Score for every row of `X` (same index), re-scoring only rows missing
+        from the cache. The cache is then rewritten with the current book only, so it never
+        grows beyond the number of live applicants.
+        """
+        started = time.perf_counter()
+        X = X[self.features] if self.features is not None else X
+        meta = self._load_meta()
+        cache = self._load_cache(meta)
+
+        hashes = feature_hashes(X, self.model_version)
+        position = pd.Index(cache['Feature_Hash'].to_numpy()).get_indexer(hashes)
+        hit = position >= 0
+
+        probability = np.empty(len(X))
+        probability[hit] = cache['PD'].to_numpy()[position[hit]]
+        misses = np.flatnonzero(~hit)
+        same_model = meta.get('model_version') == self.model_version
+        seconds_per_row = meta.get('seconds_per_row') if same_model else None
+        measured_rows = meta.get('measured_rows', 0) if same_model else 0
+        if misses.size:
+            model_started = time.perf_counter()
+            probability[misses] = self.model.predict_proba(X.iloc[misses])[:, 1]
+            # Small batches overstate the per-row cost (fixed call overhead): keep the largest measurement
+            if misses.size >= measured_rows:
+                seconds_per_row = (time.perf_counter() - model_started) / misses.size
+                measured_rows = misses.size
+
+        scores = pd.DataFrame({'PD': probability, 'Credit_Score': credit_score(probability)}, index=X.index)
+        new_cache = pd.DataFrame({'Feature_Hash': hashes, 'PD': probability,
+                                  'Credit_Score': scores['Credit_Score'].to_numpy()})
+        self._save(new_cache.drop_duplicates('Feature_Hash'), seconds_per_row, measured_rows)
+
+        elapsed = time.perf_counter() - started
+        # Time a full re-score would have taken, from the measured model cost per row
+        full_rescore = len(X) * seconds_per_row if seconds_per_row is not None else float('nan')
+        stats = {
+            'rows': len(X),
+            'cache_hits': int(hit.sum()),
+            'rescored': int(misses.size),
+            'hit_rate': float(hit.mean()) if len(X) else 0.0,
+            'elapsed_s': elapsed,
+            'full_rescore_s': full_rescore,
+            'time_saved_s': full_rescore - elapsed,
+        }
+        return scores, stats
+
+
+if __name__ == '__main__':
+    from sklearn.compose import ColumnTransformer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+    from credit_data_generator import generate_applicants
+
+    numeric_features = ['Age', 'Annual_Income', 'Years_Employed', 'Loan_Amount', 'Interest_Rate', 'DTI_Ratio',
+                        'Credit_History_Length_Years']
+    categorical_features = ['Home_Ownership', 'Loan_Purpose', 'Previous_Defaults']
+    features = numeric_features + categorical_features
+
+    book = generate_applicants(2_000_000, np.random.default_rng(42))
+    clf = Pipeline(steps=[
+        ('preprocessor', ColumnTransformer(transformers=[
+            ('num', StandardScaler(), numeric_features),
+            ('cat', OneHotEncoder(handle_unknown='ignore'), categorical_features)])),
+        ('classifier', LogisticRegression(class_weight='balanced', random_state=42))])
+    clf.fit(book[features].iloc[:50_000], book['Default_On_File'].iloc[:50_000])
+
+    scorer = IncrementalScorer(clf, "score_cache_demo", features=features)
+    rng = np.random.default_rng(7)
+    for night in range(1, 4):
+        # About 2% of the book changes every night (new loan amount, rate or income)
+        changed = rng.random(len(book)) < 0.02
+        book.loc[changed, 'Loan_Amount'] = rng.integers(1000, 35000, int(changed.sum()))
+        _, stats = scorer.score(book)
+        print(f"Night {night}: hit rate {stats['hit_rate']:.1%} | re-scored {stats['rescored']:,} rows | "
+              f"{stats['elapsed_s']:.2f}s vs ~{stats['full_rescore_s']:.2f}s full "
+              f"(saved {stats['time_saved_s']:.2f}s)")
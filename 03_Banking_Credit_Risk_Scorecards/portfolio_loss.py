@@ -0,0 +1,156 @@
+"""
+Monte Carlo loss distribution of the whole loan book (one-factor Gaussian copula).
+
+Per-loan `Expected_Loss = PD * LGD * EAD` says nothing about how losses cluster.
+Here defaults are correlated through one systematic factor Z (the economy):
+
+    asset_i = sqrt(rho) * Z + sqrt(1 - rho) * eps_i,    Z, eps_i ~ N(0, 1)
+    loan i defaults  <=>  asset_i < Phi^-1(PD_i)
+    scenario loss    =   sum_i default_i * LGD_i * EAD_i
+
+Scenarios are simulated in blocks of (scenarios x loans) float32 draws, so memory
+is bounded by `block_elements` whatever the book size, and fixed-size scenario
+shards run on a process pool. Each shard has its own generator spawned from one
+`np.random.SeedSequence`, so results are identical for any worker count
+(e.g. 1M loans x 100k scenarios on every core of the machine):
+
+    dist = simulate_portfolio_losses(pd_, lgd, ead, n_scenarios=100_000, rho=0.15, workers=8)
+    dist.summary([0.99, 0.999])   # EL, VaR and expected shortfall
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtri
+
+DEFAULT_ASSET_CORRELATION = 0.15
+DEFAULT_SHARD_SCENARIOS = 1_000
+DEFAULT_BLOCK_ELEMENTS = 4_000_000  # float32 draws per block (16 MB)
+CONFIDENCE_LEVELS = (0.95, 0.99, 0.999)
+
+# Loan book of the current worker process (set once by `_init_worker`, not pickled per task)
+_BOOK = {}
+
+
+@dataclass
+class LossDistribution:
+    """Simulated portfolio losses (one per scenario) and the analytic expected loss."""
+    losses: np.ndarray
+    expected_loss: float
+    exposure: float
+    rho: float
+
+    def value_at_risk(self, confidence: float) -> float:
+        return float(np.quantile(self.losses, confidence))
+
+    def expected_shortfall(self, confidence: float) -> float:
+        """Mean loss in the scenarios at or beyond the VaR."""
+        var = self.value_at_risk(confidence)
+        return float(self.losses[self.losses >= var].mean())
+
+    def summary(self, confidence_levels: Sequence[float] = CONFIDENCE_LEVELS) -> pd.DataFrame:
+        """EL, VaR, ES and Unexpected Loss (VaR - EL) per confidence level."""
+        rows = []
+        for confidence in confidence_levels:
+            var = self.value_at_risk(confidence)
+            rows.append({'Confidence': confidence, 'Expected_Loss': self.expected_loss,
+                         'Simulated_Mean_Loss': float(self.losses.mean()), 'VaR': var,
+                         'Expected_Shortfall': self.expected_shortfall(confidence),
+                         'Unexpected_Loss': var - self.expected_loss})
+        return pd.DataFrame(rows)
+
+
+def _init_worker(default_threshold, loss_given_default, rho, block_elements):
+    _BOOK.update(threshold=default_threshold, loss=loss_given_default, rho=rho, block_elements=block_elements)
+
+
+def _simulate_shard(n_scenarios: int, seed_sequence: np.random.SeedSequence) -> np.ndarray:
+    """Worker: portfolio losses of `n_scenarios` scenarios, in (scenarios x loans) blocks."""
+    threshold, loss, rho = _BOOK['threshold'], _BOOK['loss'], _BOOK['rho']
+    n_loans = threshold.shape[0]
+    rng = np.random.default_rng(seed_sequence)
+
+    systematic = np.sqrt(rho) * rng.standard_normal(n_scenarios, dtype=np.float32)
+    loan_block = min(n_loans, _BOOK['block_elements'])
+    scenario_block = max(1, _BOOK['block_elements'] // loan_block)
+    buffer = np.empty((scenario_block, loan_block), dtype=np.float32)
+    idiosyncratic_scale = np.float32(np.sqrt(1 - rho))
+
+    losses = np.zeros(n_scenarios)
+    for s0 in range(0, n_scenarios, scenario_block):
+        s1 = min(s0 + scenario_block, n_scenarios)
+        for l0 in range(0, n_loans, loan_block):
+            l1 = min(l0 + loan_block, n_loans)
+            assets = buffer[:s1 - s0, :l1 - l0]
+            rng.standard_normal(out=assets, dtype=np.float32)
+            assets *= idiosyncratic_scale
+            assets += systematic[s0:s1, None]
+            np.less(assets, threshold[l0:l1], out=assets)  # 1.0 where the loan defaults
+            losses[s0:s1] += assets @ loss[l0:l1]
+    return losses
+
+
+def simulate_portfolio_losses(probability_of_default, loss_given_default, exposure_at_default,
+                              n_scenarios: int = 100_000, rho: float = DEFAULT_ASSET_CORRELATION,
+                              seed: Optional[int] = None, workers: Optional[int] = None,
+                              shard_scenarios: int = DEFAULT_SHARD_SCENARIOS,
+                              block_elements: int = DEFAULT_BLOCK_ELEMENTS) -> LossDistribution:
+    """
+    Simulates `n_scenarios` correlated-default scenarios of the loan book.
+
+    - probability_of_default, exposure_at_default: one value per loan; loss_given_default: scalar or per loan.
+    - rho: asset correlation with the systematic factor (0 = independent defaults).
+    - workers: number of processes (default: all cores; 1 runs everything in-process).
+    - shard_scenarios / block_elements: scenarios per task and float32 draws held in memory per block.
+    """
+    if n_scenarios <= 0 or shard_scenarios <= 0 or block_elements <= 0:
+        raise ValueError("n_scenarios, shard_scenarios and block_elements must be positive integers.")
+    if not 0 <= rho < 1:
+        raise ValueError("rho must be in [0, 1).")
+
+    probability_of_default = np.clip(np.asarray(probability_of_default, dtype=np.float64), 1e-12, 1 - 1e-12)
+    exposure_at_default = np.asarray(exposure_at_default, dtype=np.float64)
+    loss_at_default = np.broadcast_to(np.asarray(loss_given_default, dtype=np.float64),
+                                      exposure_at_default.shape) * exposure_at_default
+    init_args = (ndtri(probability_of_default).astype(np.float32), loss_at_default.astype(np.float32),
+                 rho, block_elements)
+
+    starts = range(0, n_scenarios, shard_scenarios)
+    sizes = [min(shard_scenarios, n_scenarios - start) for start in starts]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    workers = min(workers or os.cpu_count() or 1, len(sizes))
+    if workers == 1:
+        _init_worker(*init_args)
+        shard_losses = [_simulate_shard(size, shard_seed) for size, shard_seed in zip(sizes, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args) as pool:
+            # map() returns results in submission order, so the output is deterministic
+            shard_losses = list(pool.map(_simulate_shard, sizes, seeds))
+
+    return LossDistribution(
+        losses=np.concatenate(shard_losses),
+        expected_loss=float(np.sum(probability_of_default * loss_at_default)),
+        exposure=float(exposure_at_default.sum()),
+        rho=rho,
+    )
+
+
+if __name__ == '__main__':
+    # Synthetic book: PDs from the credit scorecard's typical range, LGD 60%
+    rng = np.random.default_rng(42)
+    n_loans, n_scenarios = 100_000, 10_000
+    pd_ = rng.beta(2, 12, n_loans)
+    ead = rng.integers(1000, 35000, n_loans).astype(float)
+
+    print(f">>> Simulating {n_scenarios:,} scenarios x {n_loans:,} loans...")
+    started = time.perf_counter()
+    dist = simulate_portfolio_losses(pd_, 0.60, ead, n_scenarios=n_scenarios, seed=42)
+    elapsed = time.perf_counter() - started
+    print(f"Done in {elapsed:.1f}s ({n_loans * n_scenarios / elapsed / 1e6:,.0f}M loan-scenarios/s)")
+    print(dist.summary().to_string(index=False, float_format='{:,.0f}'.format,
+                               formatters={'Confidence': '{:.1%}'.format}))
@@ -0,0 +1,226 @@
+"""
+Compiled points-based scorecard for the credit risk model.
+
+Scoring an applicant through the fitted sklearn `Pipeline` (StandardScaler +
+OneHotEncoder + LogisticRegression) pays for input validation, scaling and
+one-hot encoding on every call. `compile_scorecard` turns the fitted pipeline
+into a classic binned points table, one additive contribution per feature bucket:
+
+    Feature          Bucket             Points
+    DTI_Ratio        [0.31, 0.38)         -42
+    Home_Ownership   RENT                 -11
+    ...
+
+Numeric features are cut at training quantiles and each bucket gets the model's
+log-odds contribution at the mean training value of that bucket; categorical
+features keep their exact one-hot coefficients. Points are integer log-odds
+(`points_per_logit` points per unit, higher = safer), so the total of an applicant is
+a plain sum. Credit_Score, PD, Risk_Rating and Decision are then looked up in
+tables indexed by that total:
+
+    card = compile_scorecard(clf, X_train); card.save("credit_scorecard.json")
+    card = Scorecard.load("credit_scorecard.json")
+    card.score_applicant({'Age': 34, 'DTI_Ratio': 0.21, ...})   # single applicant, pure Python
+    card.score(df)                                              # bulk, NumPy lookups
+"""
+import bisect
+import json
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+# Same scaling, tiers and cut-off as 'finance_project_credit_risk.py'
+MIN_SCORE = 300
+MAX_SCORE = 850
+RATING_BINS = [0, 579, 669, 739, 799, 900]
+RATING_LABELS = ['Poor', 'Fair', 'Good', 'Very Good', 'Exceptional']
+APPROVAL_CUTOFF = 600
+
+DEFAULT_BINS = 100
+POINTS_PER_LOGIT = 100  # Resolution: 1 point = 0.01 log-odds
+
+
+@dataclass
+class Scorecard:
+    """Binned points table plus total-points -> (PD, Credit_Score, Risk_Rating, Decision) lookup tables."""
+    numeric_features: List[str]
+    numeric_edges: List[np.ndarray]        # Interior bucket edges; bucket = searchsorted(edges, x, 'right')
+    numeric_points: List[np.ndarray]       # Points per bucket (len(edges) + 1)
+    categorical_features: List[str]
+    categories: List[np.ndarray]
+    categorical_points: List[np.ndarray]   # Points per category (unseen categories score 0)
+    base_points: int
+    points_per_logit: int = POINTS_PER_LOGIT
+
+    def __post_init__(self):
+        self.numeric_edges = [np.asarray(e, dtype=np.float64) for e in self.numeric_edges]
+        self.numeric_points = [np.asarray(p, dtype=np.int64) for p in self.numeric_points]
+        self.categories = [np.asarray(c) for c in self.categories]
+        self.categorical_points = [np.asarray(p, dtype=np.int64) for p in self.categorical_points]
+
+        # Pure-Python copies for the single-applicant path (no NumPy call overhead)
+        self._edges_list = [e.tolist() for e in self.numeric_edges]
+        self._points_list = [p.tolist() for p in self.numeric_points]
+        self._category_points = [dict(zip(c.tolist(), p.tolist()))
+                                 for c, p in zip(self.categories, self.categorical_points)]
+        # Trailing 0 so that code -1 (unseen category) picks up no points
+        self._categorical_lookup = [np.append(p, 0) for p in self.categorical_points]
+
+        # Every possible total, from the worst to the best bucket of each feature
+        self.min_total = int(self.base_points + sum(p.min() for p in self.numeric_points)
+                             + sum(min(p.min(), 0) for p in self.categorical_points))
+        max_total = int(self.base_points + sum(p.max() for p in self.numeric_points)
+                        + sum(max(p.max(), 0) for p in self.categorical_points))
+        totals = np.arange(self.min_total, max_total + 1)
+
+        self.pd_table = 1 / (1 + np.exp(totals / self.points_per_logit))
+        self.score_table = (MIN_SCORE + (1 - self.pd_table) * (MAX_SCORE - MIN_SCORE)).astype(np.int64)
+        self.rating_table = pd.cut(self.score_table, bins=RATING_BINS, labels=RATING_LABELS).codes
+        self.approve_table = self.score_table >= APPROVAL_CUTOFF
+        self._tables = list(zip(self.pd_table.tolist(), self.score_table.tolist(),
+                                [RATING_LABELS[c] for c in self.rating_table],
+                                ['Approve' if a else 'Reject' for a in self.approve_table]))
+
+    @property
+    def features(self) -> List[str]:
+        return self.numeric_features + self.categorical_features
+
+    # ------------------------------------------
+    # Scoring
+    # ------------------------------------------
+    def total_points(self, X) -> np.ndarray:
+        """Sum of bucket points for a DataFrame (or dict of arrays) of applicants."""
+        n_rows = len(X[self.features[0]])
+        total = np.full(n_rows, self.base_points, dtype=np.int64)
+        for feature, edges, points in zip(self.numeric_features, self.numeric_edges, self.numeric_points):
+            total += points[np.searchsorted(edges, np.asarray(X[feature], dtype=np.float64), side='right')]
+        for feature, categories, points, lookup in zip(self.categorical_features, self.categories,
+                                                       self.categorical_points, self._categorical_lookup):
+            values = X[feature]
+            if isinstance(getattr(values, 'dtype', None), pd.CategoricalDtype):
+                # Map the column's own categories once, then gather by code (-1 / unseen -> 0 points)
+                column_points = np.append(lookup[pd.Index(categories).get_indexer(values.cat.categories)], 0)
+                total += column_points[values.cat.codes.to_numpy()]
+            else:
+                # A few equality masks beat hashing millions of strings
+                for category, p in zip(categories, points):
+                    total += p * np.asarray(values == category)
+        return total
+
+    def score(self, X) -> pd.DataFrame:
+        """PD, Credit_Score, Risk_Rating and Decision for many applicants."""
+        index = np.clip(self.total_points(X) - self.min_total, 0, len(self.score_table) - 1)
+        return pd.DataFrame({
+            'PD': self.pd_table[index],
+            'Credit_Score': self.score_table[index],
+            'Risk_Rating': pd.Categorical.from_codes(self.rating_table[index], categories=RATING_LABELS),
+            'Decision': np.where(self.approve_table[index], 'Approve', 'Reject'),
+        }, index=getattr(X, 'index', None))
+
+    def score_applicant(self, applicant: Dict) -> Dict:
+        """Scores one applicant (dict of raw feature values) with lookups and sums only."""
+        total = self.base_points
+        for feature, edges, points in zip(self.numeric_features, self._edges_list, self._points_list):
+            total += points[bisect.bisect_right(edges, applicant[feature])]
+        for feature, points in zip(self.categorical_features, self._category_points):
+            total += points.get(applicant[feature], 0)
+        index = min(max(total - self.min_total, 0), len(self._tables) - 1)
+        probability, credit_score, rating, decision = self._tables[index]
+        return {'PD': probability, 'Credit_Score': credit_score, 'Risk_Rating': rating, 'Decision': decision}
+
+    # ------------------------------------------
+    # Export
+    # ------------------------------------------
+    def points_table(self) -> pd.DataFrame:
+        """Human-readable points table (one row per feature bucket) for model documentation."""
+        rows = [{'Feature': '(Base)', 'Bucket': '', 'Points': self.base_points}]
+        for feature, edges, points in zip(self.numeric_features, self.numeric_edges, self.numeric_points):
+            bounds = [-np.inf] + edges.tolist() + [np.inf]
+            for low, high, p in zip(bounds[:-1], bounds[1:], points):
+                rows.append({'Feature': feature, 'Bucket': f"[{low:.4g}, {high:.4g})", 'Points': int(p)})
+        for feature, categories, points in zip(self.categorical_features, self.categories,
+                                               self.categorical_points):
+            for category, p in zip(categories, points):
+                rows.append({'Feature': feature, 'Bucket': str(category), 'Points': int(p)})
+        return pd.DataFrame(rows)
+
+    def save(self, path: str):
+        with open(path, 'w') as f:
+            json.dump({
+                'numeric_features': self.numeric_features,
+                'numeric_edges': [e.tolist() for e in self.numeric_edges],
+                'numeric_points': [p.tolist() for p in self.numeric_points],
+                'categorical_features': self.categorical_features,
+                'categories': [c.tolist() for c in self.categories],
+                'categorical_points': [p.tolist() for p in self.categorical_points],
+                'base_points': self.base_points,
+                'points_per_logit': self.points_per_logit,
+            }, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> 'Scorecard':
+        with open(path) as f:
+            return cls(**json.load(f))
+
+
+def _bucket_values(values: np.ndarray, n_bins: int):
+    """Quantile bucket edges and the mean training value of each bucket."""
+    edges = np.unique(np.quantile(values, np.linspace(0, 1, n_bins + 1)[1:-1]))
+    buckets = np.searchsorted(edges, values, side='right')
+    counts = np.bincount(buckets, minlength=edges.size + 1)
+    sums = np.bincount(buckets, weights=values, minlength=edges.size + 1)
+    # Empty buckets (heavy ties) fall back to their nearest edge
+    fallback = np.concatenate([edges[:1], edges]) if edges.size else np.array([values.mean()])
+    return edges, np.where(counts > 0, sums / np.maximum(counts, 1), fallback)
+
+
+def compile_scorecard(pipeline: Pipeline, X_train: pd.DataFrame, n_bins: int = DEFAULT_BINS,
+                      points_per_logit: int = POINTS_PER_LOGIT) -> Scorecard:
+    """
+    Compiles a fitted Pipeline(ColumnTransformer(StandardScaler / OneHotEncoder), LogisticRegression)
+    into a `Scorecard`. `X_train` provides the quantiles used to bucket numeric features.
+    """
+    preprocessor, model = pipeline[-2], pipeline[-1]
+    coef = np.ravel(model.coef_)
+    if coef.size != model.coef_.shape[-1]:
+        raise ValueError("Only binary logistic regression models can be compiled.")
+
+    numeric_features, numeric_edges, numeric_points = [], [], []
+    categorical_features, categories, categorical_points = [], [], []
+    base_logit = float(model.intercept_[0])
+
+    for name, transformer, columns in preprocessor.transformers_:
+        if transformer == 'drop' or name == 'remainder':
+            continue
+        weights = coef[preprocessor.output_indices_[name]]
+        if isinstance(transformer, StandardScaler):
+            mean = transformer.mean_ if transformer.with_mean else np.zeros(len(columns))
+            scale = transformer.scale_ if transformer.with_std else np.ones(len(columns))
+            for column, w, m, s in zip(columns, weights, mean, scale):
+                edges, representative = _bucket_values(X_train[column].to_numpy(dtype=np.float64), n_bins)
+                numeric_features.append(column)
+                numeric_edges.append(edges)
+                # Points are "safety" points: higher total = lower log-odds of default
+                numeric_points.append(np.round(-w / s * (representative - m) * points_per_logit).astype(np.int64))
+        elif isinstance(transformer, OneHotEncoder):
+            if transformer.drop_idx_ is not None:
+                raise ValueError("OneHotEncoder(drop=...) is not supported by the scorecard compiler.")
+            offset = 0
+            for column, column_categories in zip(columns, transformer.categories_):
+                categorical_features.append(column)
+                categories.append(column_categories)
+                column_weights = weights[offset:offset + len(column_categories)]
+                categorical_points.append(np.round(-column_weights * points_per_logit).astype(np.int64))
+                offset += len(column_categories)
+        else:
+            raise ValueError(f"Unsupported transformer for '{name}': {type(transformer).__name__}.")
+
+    return Scorecard(numeric_features=numeric_features, numeric_edges=numeric_edges,
+                     numeric_points=numeric_points, categorical_features=categorical_features,
+                     categories=categories, categorical_points=categorical_points,
+                     base_points=int(round(-base_logit * points_per_logit)),
+                     points_per_logit=points_per_logit)
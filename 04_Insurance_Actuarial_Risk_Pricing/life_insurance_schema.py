@@ -0,0 +1,24 @@
+"""
+Column declaration of 'life_insurance_data' (one row per policy).
+
+Category lists come from 'pricing_engine.py', so the stored codes match the
+codes the pricing and projection engines use.
+"""
+from common.schema import Column, DatasetSchema
+
+from pricing_engine import POLICY_STATUSES, PRODUCT_TYPES, SMOKER_STATUSES
+
+GENDERS = ['Male', 'Female']
+
+LIFE_INSURANCE_SCHEMA = DatasetSchema('life_insurance_data', [
+    Column('Policy_ID', 'string'),
+    Column('Product_Type', 'category', PRODUCT_TYPES),
+    Column('Age', 'int8'),
+    Column('Gender', 'category', GENDERS),
+    Column('Smoker_Status', 'category', SMOKER_STATUSES),
+    Column('BMI', 'float32'),
+    Column('Coverage_Amount', 'int32'),
+    Column('Annual_Premium', 'float64'),
+    Column('Policy_Status', 'category', POLICY_STATUSES),
+    Column('Risk_Score', 'float32'),
+])
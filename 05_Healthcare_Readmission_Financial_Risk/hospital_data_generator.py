@@ -0,0 +1,145 @@
+"""
+Vectorized synthetic hospital episode generator (readmission & financial risk).
+
+Per-diagnosis parameters live in lookup arrays indexed by the diagnosis code,
+so length of stay, billing and penalty are computed for all patients at once,
+each with a single batched random draw:
+
+    LOS      = integers(LOS_LOW[diag], LOS_HIGH[diag])
+    Billing  = BASE_COST[diag] + LOS * 1500 + integers(-1000, 2000)
+    Penalty  = 25% of Billing if readmitted within 30 days
+
+The readmission score is min-max normalized over the *whole* dataset (as in the
+original single-batch script). For chunked output the chunks are generated
+twice from per-chunk seeds: a first pass finds the global score range, the
+second pass writes the rows, so `NUM_PATIENTS` can reach tens of millions with
+memory bounded by `chunk_size`. Columns and dtypes follow `HOSPITAL_SCHEMA`
+('hospital_schema.py'); the data is written as CSV and Parquet:
+
+    totals = write_episodes("hospital_readmission_data", 20_000_000, chunk_size=1_000_000)
+"""
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from common.schema import FORMATS, DatasetWriter
+
+from hospital_schema import ADMISSION_TYPES, DIAGNOSES, GENDERS, HOSPITAL_SCHEMA
+
+# Length of stay (days) depends on the diagnosis: integers in [low, high)
+LOS_LOW = np.array([3, 2, 1, 1, 1, 5])
+LOS_HIGH = np.array([12, 8, 10, 10, 10, 20])
+BASE_COSTS = np.array([12000, 8000, 9000, 7500, 35000, 25000])
+COST_PER_DAY = 1500
+PENALTY_RATE = 0.25  # If readmitted, the hospital loses ~25% of the bill (non-reimbursed cost)
+
+READMISSION_THRESHOLD = 0.65
+MISSING_AGE_RATE = 0.02
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+def patient_ids(start: int, n: int) -> np.ndarray:
+    """'PT_00001'-style IDs for rows start+1 .. start+n."""
+    numbers = np.arange(start + 1, start + n + 1).astype(str)
+    return np.char.add('PT_', np.char.zfill(numbers, 5))
+
+
+def _draw_episodes(n: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """All random draws of one batch (always in the same order, so a chunk can be regenerated)."""
+    ages = rng.integers(18, 95, n).astype(np.float64)
+    genders = rng.integers(0, 2, n)
+    admission_types = rng.choice(len(ADMISSION_TYPES), n, p=[0.5, 0.3, 0.15, 0.05])
+    diagnoses = rng.integers(0, len(DIAGNOSES), n)
+    los = rng.integers(LOS_LOW[diagnoses], LOS_HIGH[diagnoses])
+
+    # Comorbidities (risk factors)
+    has_diabetes = (rng.random(n) < 0.3).astype(np.int64)
+    has_hypertension = (rng.random(n) < 0.4).astype(np.int64)
+    num_prior_visits = rng.poisson(0.5, n)
+
+    # Readmission risk score: older, diabetic, hypertensive and frequent visitors return more
+    readmission_score = ((ages / 100) * 0.3 + has_diabetes * 0.2 + has_hypertension * 0.1
+                         + num_prior_visits * 0.1 + rng.normal(0, 0.1, n))
+
+    billing_amount = BASE_COSTS[diagnoses] + los * COST_PER_DAY + rng.integers(-1000, 2000, n)
+    # Some missing ages to show data cleaning downstream
+    ages[rng.random(n) < MISSING_AGE_RATE] = np.nan
+    return {'ages': ages, 'genders': genders, 'admission_types': admission_types, 'diagnoses': diagnoses,
+            'los': los, 'has_diabetes': has_diabetes, 'has_hypertension': has_hypertension,
+            'num_prior_visits': num_prior_visits, 'readmission_score': readmission_score,
+            'billing_amount': billing_amount}
+
+
+def generate_episodes(n_patients: int, rng: Optional[np.random.Generator] = None, start_id: int = 0,
+                      score_range: Optional[Tuple[float, float]] = None) -> pd.DataFrame:
+    """
+    One batch of patient episodes. `score_range` (min, max) normalizes the readmission score;
+    by default the batch's own range is used.
+    """
+    rng = rng if rng is not None else np.random.default_rng(42)
+    draws = _draw_episodes(n_patients, rng)
+    score = draws['readmission_score']
+    low, high = score_range if score_range is not None else (score.min(), score.max())
+    readmitted = ((score - low) / (high - low) > READMISSION_THRESHOLD).astype(np.int64)
+    billing = draws['billing_amount']
+
+    return pd.DataFrame({
+        'Patient_ID': patient_ids(start_id, n_patients),
+        'Age': draws['ages'],
+        'Gender': np.asarray(GENDERS)[draws['genders']],
+        'Admission_Type': np.asarray(ADMISSION_TYPES)[draws['admission_types']],
+        'Primary_Diagnosis': np.asarray(DIAGNOSES)[draws['diagnoses']],
+        'Length_of_Stay_Days': draws['los'],
+        'Has_Diabetes': draws['has_diabetes'],
+        'Has_Hypertension': draws['has_hypertension'],
+        'Prior_Emergency_Visits': draws['num_prior_visits'],
+        'Billing_Amount': billing,                                           # Revenue
+        'Readmitted_30d': readmitted,                                        # Target (0 or 1)
+        'Financial_Risk_Penalty': np.round(billing * PENALTY_RATE * readmitted, 2),  # Risk ($)
+    })
+
+
+def iter_episode_chunks(n_patients: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        seed: Optional[int] = 42) -> Iterator[pd.DataFrame]:
+    """Yields the dataset in chunks, normalizing the readmission score over all patients."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+    starts = range(0, n_patients, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+
+    # Pass 1: global range of the readmission score
+    low, high = np.inf, -np.inf
+    for start, chunk_seed in zip(starts, seeds):
+        score = _draw_episodes(min(chunk_size, n_patients - start), np.random.default_rng(chunk_seed))[
+            'readmission_score']
+        low, high = min(low, score.min()), max(high, score.max())
+
+    # Pass 2: regenerate each chunk from the same seed and emit it
+    for start, chunk_seed in zip(starts, seeds):
+        yield generate_episodes(min(chunk_size, n_patients - start), np.random.default_rng(chunk_seed),
+                                start_id=start, score_range=(low, high))
+
+
+def write_episodes(path_stem: str, n_patients: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   seed: Optional[int] = 42, formats: Sequence[str] = FORMATS) -> Dict[str, float]:
+    """
+    Streams the dataset chunk by chunk to `<path_stem>.csv` / `<path_stem>.parquet`
+    (typed with `HOSPITAL_SCHEMA`); returns totals for the run summary.
+    """
+    totals = {'patients': 0, 'readmitted': 0, 'financial_exposure': 0.0}
+    with DatasetWriter(HOSPITAL_SCHEMA, path_stem, formats) as writer:
+        for chunk in iter_episode_chunks(n_patients, chunk_size, seed):
+            chunk = writer.write(chunk)
+            totals['patients'] += len(chunk)
+            totals['readmitted'] += int(chunk['Readmitted_30d'].sum())
+            totals['financial_exposure'] += float(chunk['Financial_Risk_Penalty'].sum())
+    return totals
+
+
+def write_episodes_csv(path: str, n_patients: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       seed: Optional[int] = 42) -> Dict[str, float]:
+    """CSV-only `write_episodes` to an explicit '.csv' path."""
+    if not path.endswith('.csv'):
+        raise ValueError("path must end with '.csv'.")
+    return write_episodes(path[:-len('.csv')], n_patients, chunk_size, seed, formats=('csv',))
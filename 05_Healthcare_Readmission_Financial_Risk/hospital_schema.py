@@ -0,0 +1,27 @@
+"""
+Column declaration of 'hospital_readmission_data' (one row per patient episode).
+
+Text columns with a handful of values are categoricals with a fixed category
+list, flags and counts are small integers. Age stays a float because ~2% of the
+values are missing on purpose (data-cleaning showcase).
+"""
+from common.schema import Column, DatasetSchema
+
+DIAGNOSES = ['Heart Failure', 'Diabetes', 'Pneumonia', 'COPD', 'Hip/Knee Replacement', 'Sepsis']
+ADMISSION_TYPES = ['Emergency', 'Elective', 'Urgent', 'Trauma']
+GENDERS = ['Male', 'Female']
+
+HOSPITAL_SCHEMA = DatasetSchema('hospital_readmission_data', [
+    Column('Patient_ID', 'string'),
+    Column('Age', 'float32'),
+    Column('Gender', 'category', GENDERS),
+    Column('Admission_Type', 'category', ADMISSION_TYPES),
+    Column('Primary_Diagnosis', 'category', DIAGNOSES),
+    Column('Length_of_Stay_Days', 'int16'),
+    Column('Has_Diabetes', 'int8'),
+    Column('Has_Hypertension', 'int8'),
+    Column('Prior_Emergency_Visits', 'int16'),
+    Column('Billing_Amount', 'int32'),
+    Column('Readmitted_30d', 'int8'),
+    Column('Financial_Risk_Penalty', 'float64'),
+])
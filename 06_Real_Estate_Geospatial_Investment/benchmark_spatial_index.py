@@ -0,0 +1,80 @@
+"""
+Benchmark: KD-tree comps index (spatial_index.py) vs. brute-force scans.
+
+Generates 1M properties, builds the index, checks that index and brute force
+return the same k-nearest and radius comps, then measures per-query latency
+(one subject at a time, as in the deal screener) and batched throughput. Also
+reports how close the comps-based fair value lands to the generated
+Fair_Market_Value.
+
+Run: python benchmark_spatial_index.py
+"""
+import time
+
+import numpy as np
+
+from real_estate_generator import generate_properties
+from spatial_index import CompIndex, brute_force_knn, brute_force_within
+
+N_PROPERTIES = 1_000_000
+N_BRUTE_QUERIES = 200
+N_BATCH_QUERIES = 100_000
+K = 10
+RADIUS_KM = 0.25
+
+
+def per_query_ms(query, lat, lon) -> float:
+    """Median latency (ms) of one query per call."""
+    timings = []
+    for i in range(len(lat)):
+        started = time.perf_counter()
+        query(lat[i:i + 1], lon[i:i + 1])
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings) * 1000)
+
+
+if __name__ == '__main__':
+    print(f">>> Generating {N_PROPERTIES:,} properties...")
+    properties = generate_properties(N_PROPERTIES, np.random.default_rng(42))
+
+    started = time.perf_counter()
+    index = CompIndex.from_frame(properties)
+    build_s = time.perf_counter() - started
+    print(f"Index built in {build_s:.2f}s")
+
+    subjects = generate_properties(N_BATCH_QUERIES, np.random.default_rng(7))
+    lat, lon = subjects['Latitude'].to_numpy(), subjects['Longitude'].to_numpy()
+    sample_lat, sample_lon = lat[:N_BRUTE_QUERIES], lon[:N_BRUTE_QUERIES]
+
+    # Same answers
+    index_d, index_pos = index.knn(sample_lat, sample_lon, K)
+    brute_d, brute_pos = brute_force_knn(index.points_km, sample_lat, sample_lon, K)
+    knn_match = np.mean([set(a) == set(b) for a, b in zip(index_pos, brute_pos)])
+    radius_match = np.mean([np.array_equal(a, b) for a, b in
+                            zip(index.within(sample_lat, sample_lon, RADIUS_KM),
+                                brute_force_within(index.points_km, sample_lat, sample_lon, RADIUS_KM))])
+    print(f"Identical comps vs. brute force: k-NN {knn_match:.1%} (max distance diff "
+          f"{np.abs(index_d - brute_d).max():.1e} km), radius {radius_match:.1%}")
+
+    # Single-subject latency
+    index_knn_ms = per_query_ms(lambda a, b: index.knn(a, b, K), sample_lat, sample_lon)
+    brute_knn_ms = per_query_ms(lambda a, b: brute_force_knn(index.points_km, a, b, K), sample_lat, sample_lon)
+    index_radius_ms = per_query_ms(lambda a, b: index.within(a, b, RADIUS_KM), sample_lat, sample_lon)
+    brute_radius_ms = per_query_ms(lambda a, b: brute_force_within(index.points_km, a, b, RADIUS_KM),
+                                   sample_lat, sample_lon)
+
+    # Batched k-NN / fair value for the whole subject list
+    started = time.perf_counter()
+    estimate = index.fair_value(lat, lon, subjects['Square_Feet'].to_numpy(), K)
+    batch_s = time.perf_counter() - started
+    error = np.abs(estimate / subjects['Fair_Market_Value'].to_numpy() - 1)
+
+    print("------------------------------------------------")
+    print(f"{'':<26}{'brute':>12}{'KD-tree':>12}{'speed-up':>10}")
+    print(f"{f'{K}-NN query (ms)':<26}{brute_knn_ms:>12.3f}{index_knn_ms:>12.3f}{brute_knn_ms / index_knn_ms:>9.0f}x")
+    print(f"{f'Radius {RADIUS_KM} km query (ms)':<26}{brute_radius_ms:>12.3f}{index_radius_ms:>12.3f}"
+          f"{brute_radius_ms / index_radius_ms:>9.0f}x")
+    print("------------------------------------------------")
+    print(f"Batched comps fair value: {N_BATCH_QUERIES:,} subjects in {batch_s:.2f}s "
+          f"({N_BATCH_QUERIES / batch_s:,.0f} subjects/s)")
+    print(f"|Comps estimate / Fair_Market_Value - 1|: median {np.median(error):.1%}, p90 {np.percentile(error, 90):.1%}")
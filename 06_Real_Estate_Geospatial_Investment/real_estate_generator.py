@@ -0,0 +1,99 @@
+"""
+Vectorized synthetic Boston listings generator.
+
+Each attribute is one batched draw for all properties (no per-property loop),
+and the deal metrics come from `value_properties` ('valuation_engine.py'):
+
+    Fair_Market_Value = base_price[nbhd] * sqft / 1500 + bedrooms * 50,000 + noise
+    Listing_Price     = Fair_Market_Value * N(1.0, 0.15)       (discounted / overpriced)
+    Renovation_Cost   = U[50k, 150k) if condition < 5, U[10k, 40k) if < 8, else 0
+    Latitude/Longitude  scattered around the neighborhood center ('spatial_index.py')
+
+Large datasets are generated in chunks with one SeedSequence child per chunk
+and streamed to CSV / Parquet with `REAL_ESTATE_SCHEMA`:
+
+    totals = write_properties("boston_real_estate_data", 10_000_000, chunk_size=1_000_000)
+"""
+from typing import Dict, Iterator, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from common.schema import FORMATS, DatasetWriter
+
+from real_estate_schema import REAL_ESTATE_SCHEMA
+from spatial_index import scatter_coordinates
+from valuation_engine import (BASE_PRICES, NEIGHBORHOODS, RENOVATION_HIGH, RENOVATION_LOW, REFERENCE_SQFT,
+                              VALUE_PER_BEDROOM, renovation_band, value_properties)
+
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+
+def property_ids(start: int, n: int) -> np.ndarray:
+    """'PROP_0000'-style IDs for rows start .. start+n-1."""
+    return np.char.add('PROP_', np.char.zfill(np.arange(start, start + n).astype(str), 4))
+
+
+def generate_properties(n_properties: int, rng: Optional[np.random.Generator] = None,
+                        start_id: int = 0) -> pd.DataFrame:
+    """One batch of listings with their valuation."""
+    rng = rng if rng is not None else np.random.default_rng(42)
+    codes = rng.integers(0, len(NEIGHBORHOODS), n_properties)
+    sqft = rng.integers(600, 3500, n_properties)
+    bedrooms = rng.integers(1, 6, n_properties)
+
+    # Fair Market Value: neighborhood + size + bedrooms + noise
+    fair_value = (BASE_PRICES[codes] * (sqft / REFERENCE_SQFT) + bedrooms * VALUE_PER_BEDROOM
+                  + rng.integers(-50000, 50000, n_properties))
+    # Some listings are discounted (opportunities), others overpriced
+    listing_price = fair_value * rng.normal(1.0, 0.15, n_properties)
+
+    # Condition drives the renovation budget (one draw per band, bounds from a lookup)
+    condition = rng.integers(1, 11, n_properties)
+    band = renovation_band(condition)
+    renovation_cost = rng.integers(RENOVATION_LOW[band], np.maximum(RENOVATION_HIGH[band], RENOVATION_LOW[band] + 1))
+
+    # Location (drawn last, so the other attributes do not depend on it)
+    latitude, longitude = scatter_coordinates(codes, rng)
+
+    deals = value_properties(codes, sqft, bedrooms, condition, listing_price,
+                             fair_value=fair_value, renovation_cost=renovation_cost)
+    return pd.DataFrame({
+        'Property_ID': property_ids(start_id, n_properties),
+        'Neighborhood': pd.Categorical.from_codes(codes, categories=NEIGHBORHOODS),
+        'Square_Feet': sqft,
+        'Bedrooms': bedrooms,
+        'Condition_Score': condition,
+        'Listing_Price': np.round(listing_price, 2),
+        'Fair_Market_Value': np.round(fair_value, 2),
+        'Renovation_Cost': renovation_cost,
+        'Total_Investment': np.round(listing_price + renovation_cost, 2),
+        'Cap_Rate_Pct': deals['Cap_Rate_Pct'].to_numpy(),
+        'ROI_Pct': deals['ROI_Pct'].to_numpy(),
+        'Action_Recommendation': deals['Action_Recommendation'].to_numpy(),
+        'Latitude': latitude,
+        'Longitude': longitude,
+    })
+
+
+def iter_property_chunks(n_properties: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         seed: Optional[int] = 42) -> Iterator[pd.DataFrame]:
+    """Yields the dataset in chunks of at most `chunk_size` rows (one SeedSequence child per chunk)."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+    starts = range(0, n_properties, chunk_size)
+    for start, chunk_seed in zip(starts, np.random.SeedSequence(seed).spawn(len(starts))):
+        yield generate_properties(min(chunk_size, n_properties - start), np.random.default_rng(chunk_seed),
+                                  start_id=start)
+
+
+def write_properties(path_stem: str, n_properties: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     seed: Optional[int] = 42, formats: Sequence[str] = FORMATS) -> Dict[str, float]:
+    """Streams the dataset to `<path_stem>.csv` / `.parquet`; returns totals for the run summary."""
+    totals = {'properties': 0, 'buy': 0}
+    with DatasetWriter(REAL_ESTATE_SCHEMA, path_stem, formats) as writer:
+        for chunk in iter_property_chunks(n_properties, chunk_size, seed):
+            chunk = writer.write(chunk)
+            totals['properties'] += len(chunk)
+            totals['buy'] += int((chunk['Action_Recommendation'] == 'Buy').sum())
+    return totals
@@ -0,0 +1,27 @@
+"""
+Column declaration of 'boston_real_estate_data' (one row per listed property).
+
+Neighborhoods and actions come from 'valuation_engine.py', so the stored codes
+match the lookup arrays of the valuation.
+"""
+from common.schema import Column, DatasetSchema
+
+from valuation_engine import ACTIONS, NEIGHBORHOODS
+
+REAL_ESTATE_SCHEMA = DatasetSchema('boston_real_estate_data', [
+    Column('Property_ID', 'string'),
+    Column('Neighborhood', 'category', NEIGHBORHOODS),
+    Column('Square_Feet', 'int16'),
+    Column('Bedrooms', 'int8'),
+    Column('Condition_Score', 'int8'),
+    Column('Listing_Price', 'float64'),
+    Column('Fair_Market_Value', 'float64'),
+    Column('Renovation_Cost', 'int32'),
+    Column('Total_Investment', 'float64'),
+    Column('Cap_Rate_Pct', 'float32'),
+    Column('ROI_Pct', 'float32'),
+    Column('Action_Recommendation', 'category', ACTIONS),
+    # Appended after the original columns, so the Power BI report's column layout is unchanged
+    Column('Latitude', 'float64'),
+    Column('Longitude', 'float64'),
+])
@@ -0,0 +1,136 @@
+"""
+Synthetic coordinates and a spatial index for comparable-property ("comps") queries.
+
+Each Boston neighborhood has a center and a spread; properties are scattered
+around their neighborhood center with a Gaussian draw. Coordinates are
+projected to a local planar grid in km (equirectangular, exact to a few meters
+at city scale) and indexed with a KD-tree (`scipy.spatial.cKDTree`, shipped
+with scikit-learn's dependencies), so a query touches a handful of tree nodes
+instead of scanning every property:
+
+    index = CompIndex.from_frame(properties)
+    distances_km, comps = index.knn(lat, lon, k=10)          # k nearest comps
+    comps = index.within(lat, lon, radius_km=0.5)            # all comps within 500 m
+    estimate = index.fair_value(lat, lon, sqft, k=10)        # comps $/sqft x subject sqft
+
+The fair value estimate is the inverse-distance weighted listing price per
+square foot of the comps, times the subject's square footage.
+"""
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+# Neighborhood centers (lat, lon) and spread (km, 1 std) - same order as NEIGHBORHOODS
+NEIGHBORHOOD_CENTERS = np.array([
+    [42.3588, -71.0707],  # Beacon Hill
+    [42.3503, -71.0810],  # Back Bay
+    [42.3388, -71.0765],  # South End
+    [42.3429, -71.1003],  # Fenway
+    [42.3016, -71.0676],  # Dorchester
+    [42.3486, -71.0422],  # Seaport
+    [42.3736, -71.1097],  # Cambridge
+])
+NEIGHBORHOOD_SPREAD_KM = np.array([0.4, 0.6, 0.7, 0.7, 2.0, 0.6, 1.5])
+
+REFERENCE_LATITUDE = 42.35  # Projection origin (Boston)
+KM_PER_DEGREE_LAT = 110.574
+KM_PER_DEGREE_LON = 111.320 * np.cos(np.radians(REFERENCE_LATITUDE))
+DISTANCE_FLOOR_KM = 0.05    # Inverse-distance weights: comps closer than 50 m count as 50 m
+
+
+def to_km(lat, lon) -> np.ndarray:
+    """(n, 2) planar coordinates in km from latitude / longitude arrays."""
+    return np.column_stack([np.asarray(lon, dtype=np.float64) * KM_PER_DEGREE_LON,
+                            np.asarray(lat, dtype=np.float64) * KM_PER_DEGREE_LAT])
+
+
+def scatter_coordinates(codes, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Latitude / longitude (6 decimals) around each property's neighborhood center."""
+    codes = np.asarray(codes)
+    offsets_km = rng.normal(0.0, 1.0, (len(codes), 2)) * NEIGHBORHOOD_SPREAD_KM[codes][:, None]
+    lat = NEIGHBORHOOD_CENTERS[codes, 0] + offsets_km[:, 0] / KM_PER_DEGREE_LAT
+    lon = NEIGHBORHOOD_CENTERS[codes, 1] + offsets_km[:, 1] / KM_PER_DEGREE_LON
+    return np.round(lat, 6), np.round(lon, 6)
+
+
+@dataclass
+class CompIndex:
+    """KD-tree over property locations, with each property's listing price per square foot."""
+    points_km: np.ndarray
+    price_per_sqft: np.ndarray
+    tree: cKDTree = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.tree = cKDTree(self.points_km)
+
+    @classmethod
+    def from_frame(cls, properties: pd.DataFrame) -> 'CompIndex':
+        """Index of a dataset with Latitude, Longitude, Listing_Price and Square_Feet."""
+        return cls(points_km=to_km(properties['Latitude'], properties['Longitude']),
+                   price_per_sqft=(properties['Listing_Price'].to_numpy(dtype=np.float64)
+                                   / properties['Square_Feet'].to_numpy(dtype=np.float64)))
+
+    def __len__(self) -> int:
+        return len(self.points_km)
+
+    def _check_k(self, k: int):
+        if k < 1 or k > len(self):
+            raise ValueError(f"k must be between 1 and the number of indexed properties ({len(self):,}), got {k}.")
+
+    # ------------------------------------------
+    # Queries (positions are row positions in the indexed frame)
+    # ------------------------------------------
+    def knn(self, lat, lon, k: int = 10, workers: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Distances (km) and positions of the `k` nearest properties, shape (queries, k), nearest first."""
+        self._check_k(k)
+        distances, positions = self.tree.query(to_km(lat, lon), k=k, workers=workers)
+        return distances.reshape(-1, k), positions.reshape(-1, k)
+
+    def within(self, lat, lon, radius_km: float, workers: int = 1) -> List[np.ndarray]:
+        """Positions of all properties within `radius_km` of each query point (sorted)."""
+        matches = self.tree.query_ball_point(to_km(lat, lon), r=radius_km, workers=workers)
+        return [np.sort(np.asarray(m, dtype=np.intp)) for m in matches]
+
+    def fair_value(self, lat, lon, sqft, k: int = 10, exclude: Optional[np.ndarray] = None,
+                   workers: int = 1) -> np.ndarray:
+        """
+        Comps-based fair value: inverse-distance weighted $/sqft of the `k` nearest comps x `sqft`.
+        `exclude` (one position per query, e.g. the subject itself when it is in the index) is skipped.
+        """
+        self._check_k(k)
+        n_neighbors = k + 1 if exclude is not None else k
+        if n_neighbors > len(self):
+            raise ValueError(f"k + 1 (subject excluded) exceeds the number of indexed properties ({len(self):,}).")
+        distances, positions = self.knn(lat, lon, n_neighbors, workers)
+        weights = 1.0 / np.maximum(distances, DISTANCE_FLOOR_KM)
+        if exclude is not None:
+            is_self = positions == np.asarray(exclude)[:, None]
+            # Drop the subject if found, otherwise the farthest of the k+1 comps
+            is_self[~is_self.any(axis=1), -1] = True
+            weights[is_self] = 0.0
+        comp_price = self.price_per_sqft[positions]
+        return np.round((weights * comp_price).sum(axis=1) / weights.sum(axis=1) * np.asarray(sqft), 2)
+
+
+# ------------------------------------------
+# Brute force references (full scan of every property)
+# ------------------------------------------
+def brute_force_knn(points_km: np.ndarray, lat, lon, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+    queries = to_km(lat, lon)
+    distances = np.empty((len(queries), k))
+    positions = np.empty((len(queries), k), dtype=np.intp)
+    for i, query in enumerate(queries):
+        d = np.hypot(points_km[:, 0] - query[0], points_km[:, 1] - query[1])
+        nearest = np.argpartition(d, k - 1)[:k]
+        nearest = nearest[np.argsort(d[nearest], kind='stable')]
+        distances[i], positions[i] = d[nearest], nearest
+    return distances, positions
+
+
+def brute_force_within(points_km: np.ndarray, lat, lon, radius_km: float) -> List[np.ndarray]:
+    return [np.flatnonzero(np.hypot(points_km[:, 0] - query[0], points_km[:, 1] - query[1]) <= radius_km)
+            for query in to_km(lat, lon)]
+
@@ -0,0 +1,146 @@
+"""
+Scenario stress engine for the real estate deal book.
+
+"What if rates rise 200bp and rents fall 10%?" Every scenario of a shock grid
+is applied to every property at once, as (scenarios x properties) matrices,
+with the same deal logic as 'valuation_engine.py':
+
+    Annual_Rent       = Fair_Market_Value * rent_factor[nbhd] * (1 + rent_shock)
+    Exit_Value        = Fair_Market_Value * (1 + price_shock)
+    Total_Investment  = Listing_Price + Renovation_Cost * (1 + renovation_shock)
+    Cap_Rate_Pct      = Annual_Rent / Total_Investment * 100
+    ROI_Pct           = (Exit_Value - Total_Investment) / Total_Investment * 100
+    Buy               if Cap_Rate_Pct > 5.5 + rate_shock_bp / 100 or ROI_Pct > 15 + rate_shock_bp / 100
+
+A rate shock raises both hurdles by the same amount, because a higher cost of
+capital raises the yield and the return that investors require. Listing
+prices are fixed (deals already on the table). Properties are processed in
+chunks sized so that one (scenarios x chunk) block holds about
+`block_elements` values, which bounds memory for any grid and book size:
+
+    grid = scenario_grid(rent_shocks=[-0.1, 0], price_shocks=[-0.1, 0], rate_shocks_bp=[0, 200])
+    result = stress_test(df, grid)
+    result.scenarios                # Buy count, flips vs. base, capital deployed, portfolio cap rate / ROI
+    result.property_flip_share      # Share of scenarios in which each property's decision flips
+"""
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from valuation_engine import CAP_RATE_THRESHOLD, RENT_FACTORS, ROI_THRESHOLD, neighborhood_codes
+
+SHOCKS = ['Rent_Shock', 'Price_Shock', 'Renovation_Shock', 'Rate_Shock_bp']
+DEFAULT_BLOCK_ELEMENTS = 4_000_000
+
+
+@dataclass
+class StressResult:
+    """Portfolio totals per scenario, and how often each property's Buy/Pass decision flips."""
+    scenarios: pd.DataFrame
+    property_flip_share: pd.Series
+
+    def scenario(self, **shocks) -> pd.Series:
+        """Row of one scenario, e.g. `result.scenario(Rent_Shock=-0.1, Rate_Shock_bp=200)` (others at 0)."""
+        mask = np.ones(len(self.scenarios), dtype=bool)
+        for name in SHOCKS:
+            mask &= np.isclose(self.scenarios[name], shocks.get(name, 0.0))
+        if not mask.any():
+            raise KeyError(f"No scenario with {shocks} in the grid.")
+        return self.scenarios[mask].iloc[0]
+
+
+def scenario_grid(rent_shocks: Sequence[float] = (0.0,), price_shocks: Sequence[float] = (0.0,),
+                  renovation_shocks: Sequence[float] = (0.0,),
+                  rate_shocks_bp: Sequence[float] = (0.0,)) -> pd.DataFrame:
+    """Cartesian product of the shocks (relative changes; rates in basis points)."""
+    return pd.DataFrame(list(itertools.product(rent_shocks, price_shocks, renovation_shocks, rate_shocks_bp)),
+                        columns=SHOCKS, dtype=np.float64)
+
+
+def stress_test(properties: pd.DataFrame, scenarios: pd.DataFrame,
+                block_elements: int = DEFAULT_BLOCK_ELEMENTS) -> StressResult:
+    """
+    Evaluates every scenario of `scenarios` (see `scenario_grid`) on a book with Neighborhood,
+    Listing_Price, Fair_Market_Value and Renovation_Cost columns.
+    """
+    if block_elements <= 0:
+        raise ValueError("block_elements must be a positive integer.")
+    rent_shock, price_shock, renovation_shock, rate_shock = (
+        scenarios[name].to_numpy(dtype=np.float64)[:, None] for name in SHOCKS)
+    cap_hurdle = CAP_RATE_THRESHOLD + rate_shock / 100
+    roi_hurdle = ROI_THRESHOLD + rate_shock / 100
+
+    fair_value = properties['Fair_Market_Value'].to_numpy(dtype=np.float64)
+    listing_price = properties['Listing_Price'].to_numpy(dtype=np.float64)
+    renovation_cost = properties['Renovation_Cost'].to_numpy(dtype=np.float64)
+    base_rent = fair_value * RENT_FACTORS[neighborhood_codes(properties['Neighborhood'])]
+
+    n_scenarios, n_properties = len(scenarios), len(properties)
+    totals = {name: np.zeros(n_scenarios) for name in
+              ('buys', 'to_pass', 'to_buy', 'capital', 'rent', 'profit')}
+    flips = np.zeros(n_properties, dtype=np.int64)
+    chunk_size = max(1, block_elements // max(n_scenarios, 1))
+
+    for start in range(0, n_properties, chunk_size):
+        rows = slice(start, start + chunk_size)
+        # Base decision (no shock), same formula as valuation_engine.value_properties
+        base_investment = listing_price[rows] + renovation_cost[rows]
+        base_buy = ((base_rent[rows] / base_investment * 100 > CAP_RATE_THRESHOLD)
+                    | ((fair_value[rows] - base_investment) / base_investment * 100 > ROI_THRESHOLD))
+
+        # (scenarios x chunk) blocks
+        investment = listing_price[rows] + renovation_cost[rows] * (1 + renovation_shock)
+        rent = base_rent[rows] * (1 + rent_shock)
+        profit = fair_value[rows] * (1 + price_shock) - investment
+        buy = (rent / investment * 100 > cap_hurdle) | (profit / investment * 100 > roi_hurdle)
+
+        flipped = buy != base_buy
+        totals['buys'] += buy.sum(axis=1)
+        totals['to_pass'] += (flipped & base_buy).sum(axis=1)
+        totals['to_buy'] += (flipped & ~base_buy).sum(axis=1)
+        totals['capital'] += np.where(buy, investment, 0.0).sum(axis=1)
+        totals['rent'] += np.where(buy, rent, 0.0).sum(axis=1)
+        totals['profit'] += np.where(buy, profit, 0.0).sum(axis=1)
+        flips[rows] = flipped.sum(axis=0)
+
+    capital = np.where(totals['capital'] > 0, totals['capital'], np.nan)
+    table = scenarios[SHOCKS].reset_index(drop=True).copy()
+    table['Buy_Count'] = totals['buys'].astype(np.int64)
+    table['Flips_To_Pass'] = totals['to_pass'].astype(np.int64)
+    table['Flips_To_Buy'] = totals['to_buy'].astype(np.int64)
+    table['Capital_Deployed'] = np.round(totals['capital'], 2)
+    table['Annual_Rent'] = np.round(totals['rent'], 2)
+    table['Expected_Profit'] = np.round(totals['profit'], 2)
+    table['Portfolio_Cap_Rate_Pct'] = np.round(totals['rent'] / capital * 100, 2)
+    table['Portfolio_ROI_Pct'] = np.round(totals['profit'] / capital * 100, 2)
+    return StressResult(scenarios=table,
+                        property_flip_share=pd.Series(flips / max(n_scenarios, 1), index=properties.index,
+                                                      name='Flip_Share'))
+
+
+if __name__ == '__main__':
+    from real_estate_generator import generate_properties
+
+    n_properties = 1_000_000
+    book = generate_properties(n_properties, np.random.default_rng(42))
+    grid = scenario_grid(rent_shocks=[-0.2, -0.1, 0.0, 0.05], price_shocks=[-0.2, -0.1, 0.0, 0.1],
+                         renovation_shocks=[0.0, 0.25, 0.5], rate_shocks_bp=[0, 100, 200])
+
+    print(f">>> Stressing {n_properties:,} properties under {len(grid)} scenarios...")
+    started = time.perf_counter()
+    result = stress_test(book, grid)
+    elapsed = time.perf_counter() - started
+    print(f"Done in {elapsed:.1f}s ({len(grid) * n_properties / elapsed:,.0f} property-scenarios/s)")
+
+    base = result.scenario()
+    committee = result.scenario(Rent_Shock=-0.1, Rate_Shock_bp=200)
+    print(f"🏠 Base: {base['Buy_Count']:,.0f} buys, ${base['Capital_Deployed']:,.0f} deployed, "
+          f"cap rate {base['Portfolio_Cap_Rate_Pct']:.2f}%")
+    print(f"📉 Rates +200bp & rents -10%: {committee['Buy_Count']:,.0f} buys "
+          f"({committee['Flips_To_Pass']:,.0f} flip to Pass), cap rate {committee['Portfolio_Cap_Rate_Pct']:.2f}%")
+    print(f"⚠️ Properties flipping in more than half of the scenarios: "
+          f"{(result.property_flip_share > 0.5).mean():.1%}")
@@ -0,0 +1,126 @@
+"""
+Vectorized deal valuation for the Boston real estate screener.
+
+Every listing is valued with array operations. Neighborhood parameters live in
+lookup arrays indexed by the neighborhood code, and the investment rule is a
+broadcast comparison:
+
+    Fair_Market_Value = base_price[nbhd] * sqft / 1500 + bedrooms * 50,000
+    Total_Investment  = Listing_Price + Renovation_Cost
+    Cap_Rate_Pct      = Fair_Market_Value * rent_factor[nbhd] / Total_Investment * 100
+    ROI_Pct           = (Fair_Market_Value - Total_Investment) / Total_Investment * 100
+    Buy               if Cap_Rate_Pct > 5.5 or ROI_Pct > 15
+
+When the fair value or renovation cost of a listing is unknown (a new listing
+on the market), the model estimate is used: the hedonic formula above without
+noise, and the expected renovation cost of the condition band. A million
+listings are re-valued in well under a second:
+
+    deals = value_properties(df['Neighborhood'], df['Square_Feet'], df['Bedrooms'],
+                             df['Condition_Score'], df['Listing_Price'])
+"""
+import time
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+NEIGHBORHOODS = ['Beacon Hill', 'Back Bay', 'South End', 'Fenway', 'Dorchester', 'Seaport', 'Cambridge']
+BASE_PRICES = np.array([1500000, 1800000, 1200000, 800000, 600000, 1400000, 950000])
+RENT_FACTORS = np.array([0.04, 0.038, 0.045, 0.05, 0.06, 0.042, 0.048])  # Annual rent / fair value
+
+REFERENCE_SQFT = 1500
+VALUE_PER_BEDROOM = 50000
+
+# Renovation cost by condition score (1 = poor .. 10 = new): [low, high) dollars
+RENOVATION_CONDITION_CUTOFFS = np.array([5, 8])  # < 5: heavy, < 8: light, else none
+RENOVATION_LOW = np.array([50000, 10000, 0])
+RENOVATION_HIGH = np.array([150000, 40000, 0])
+
+CAP_RATE_THRESHOLD = 5.5  # %
+ROI_THRESHOLD = 15.0      # %
+ACTIONS = ['Pass', 'Buy']
+
+
+def neighborhood_codes(values) -> np.ndarray:
+    """Codes into NEIGHBORHOODS for labels, categoricals or integer codes."""
+    if isinstance(getattr(values, 'dtype', None), pd.CategoricalDtype):
+        values = pd.Categorical(values).set_categories(NEIGHBORHOODS)
+        codes = values.codes
+    else:
+        values = np.asarray(values)
+        if np.issubdtype(values.dtype, np.integer):
+            codes = values
+        else:
+            codes = np.full(values.shape, -1, dtype=np.int8)
+            for code, neighborhood in enumerate(NEIGHBORHOODS):
+                codes[values == neighborhood] = code
+    if codes.size and (codes.min() < 0 or codes.max() >= len(NEIGHBORHOODS)):
+        raise ValueError(f"Unknown neighborhood, expected one of {NEIGHBORHOODS}.")
+    return codes
+
+
+def renovation_band(condition) -> np.ndarray:
+    """0 = heavy renovation, 1 = light, 2 = none."""
+    return np.searchsorted(RENOVATION_CONDITION_CUTOFFS, np.asarray(condition), side='right')
+
+
+def model_fair_value(codes, sqft, bedrooms) -> np.ndarray:
+    """Hedonic fair value estimate (no idiosyncratic noise)."""
+    return (BASE_PRICES[codes] * (np.asarray(sqft) / REFERENCE_SQFT)
+            + np.asarray(bedrooms) * VALUE_PER_BEDROOM)
+
+
+def expected_renovation_cost(condition) -> np.ndarray:
+    band = renovation_band(condition)
+    return (RENOVATION_LOW[band] + RENOVATION_HIGH[band]) / 2
+
+
+def value_properties(neighborhood, sqft, bedrooms, condition, listing_price,
+                     fair_value: Optional[np.ndarray] = None,
+                     renovation_cost: Optional[np.ndarray] = None) -> pd.DataFrame:
+    """
+    Cap_Rate_Pct, ROI_Pct (rounded to 2 decimals) and Action_Recommendation for arrays of listings.
+    `fair_value` / `renovation_cost` default to the model estimates when not known.
+    """
+    codes = neighborhood_codes(neighborhood)
+    if fair_value is None:
+        fair_value = model_fair_value(codes, sqft, bedrooms)
+    if renovation_cost is None:
+        renovation_cost = expected_renovation_cost(condition)
+    fair_value = np.asarray(fair_value, dtype=np.float64)
+    total_investment = np.asarray(listing_price, dtype=np.float64) + np.asarray(renovation_cost)
+
+    cap_rate = fair_value * RENT_FACTORS[codes] / total_investment * 100
+    roi = (fair_value - total_investment) / total_investment * 100
+    buy = (cap_rate > CAP_RATE_THRESHOLD) | (roi > ROI_THRESHOLD)
+    return pd.DataFrame({
+        'Cap_Rate_Pct': np.round(cap_rate, 2),
+        'ROI_Pct': np.round(roi, 2),
+        'Action_Recommendation': pd.Categorical.from_codes(buy.astype(np.int8), categories=ACTIONS),
+    }, index=getattr(listing_price, 'index', None))
+
+
+if __name__ == '__main__':
+    # Deal screener load test: re-value a million new listings
+    n_listings = 1_000_000
+    rng = np.random.default_rng(42)
+    listings = pd.DataFrame({
+        'Neighborhood': pd.Categorical.from_codes(rng.integers(0, len(NEIGHBORHOODS), n_listings),
+                                                  categories=NEIGHBORHOODS),
+        'Square_Feet': rng.integers(600, 3500, n_listings),
+        'Bedrooms': rng.integers(1, 6, n_listings),
+        'Condition_Score': rng.integers(1, 11, n_listings),
+    })
+    listings['Listing_Price'] = np.round(model_fair_value(neighborhood_codes(listings['Neighborhood']),
+                                                          listings['Square_Feet'], listings['Bedrooms'])
+                                         * rng.normal(1.0, 0.15, n_listings), 2)
+
+    for label, neighborhoods in (('categorical', listings['Neighborhood']),
+                                 ('text', listings['Neighborhood'].astype(str))):
+        started = time.perf_counter()
+        deals = value_properties(neighborhoods, listings['Square_Feet'], listings['Bedrooms'],
+                                 listings['Condition_Score'], listings['Listing_Price'])
+        elapsed = time.perf_counter() - started
+        print(f">>> {n_listings:,} listings ({label} neighborhoods) valued in {elapsed:.3f}s "
+              f"({n_listings / elapsed:,.0f} listings/s) | Buy: {(deals['Action_Recommendation'] == 'Buy').mean():.1%}")
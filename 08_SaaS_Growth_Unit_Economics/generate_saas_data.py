@@ -3,10 +3,14 @@ import numpy as np
 import random
 from datetime import datetime, timedelta
 
+from common.schema import memory_mb  # Pacote da raiz do repositório (pip install -e .)
+from saas_schema import SAAS_SCHEMA
+
 # Configurações
 NUM_CUSTOMERS = 8000
 START_DATE = datetime(2023, 1, 1)
 END_DATE = datetime(2025, 1, 1)
+OUTPUT_FORMATS = ('csv', 'parquet')  # Parquet: tipos compactos/categóricos preservados (ver 'saas_schema.py')
 random.seed(42)
 np.random.seed(42)
 
@@ -83,8 +87,11 @@ df = pd.DataFrame({
 # Preencher datas nulas de churn (para Power BI não reclamar)
 df['Churn_Date'] = df['Churn_Date'].fillna(pd.NaT)
 
-# Salvar
-df.to_csv('saas_growth_data.csv', index=False)
-print("✅ SaaS Data Generated!")
+# Tipos declarados uma vez em 'saas_schema.py' (categorias, datas e inteiros compactos)
+df = SAAS_SCHEMA.apply(df)
+
+# Salvar (CSV para o Power BI + Parquet)
+SAAS_SCHEMA.write(df, 'saas_growth_data', formats=OUTPUT_FORMATS)
+print(f"✅ SaaS Data Generated! ({memory_mb(df):.1f} MB in memory)")
 print(f"💰 Total ARR (Annual Run Rate): ${(df[df['Status']=='Active']['MRR'].sum() * 12):,.2f}")
 print(f"📉 Churned Customers: {df[df['Status']=='Churned'].shape[0]}")
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""
+Column declaration of 'saas_growth_data' (one row per customer).
+
+Churn_Date is empty (NaT) for active customers.
+"""
+from common.schema import Column, DatasetSchema
+
+SEGMENTS = ['SMB', 'Mid-Market', 'Enterprise']
+ACQUISITION_CHANNELS = ['Organic', 'Paid Ads', 'Referral', 'Sales Outbound']
+STATUSES = ['Active', 'Churned']
+
+SAAS_SCHEMA = DatasetSchema('saas_growth_data', [
+    Column('Customer_ID', 'string'),
+    Column('Segment', 'category', SEGMENTS),
+    Column('Acquisition_Channel', 'category', ACQUISITION_CHANNELS),
+    Column('Signup_Date', 'datetime64[ns]'),
+    Column('Churn_Date', 'datetime64[ns]'),
+    Column('Status', 'category', STATUSES),
+    Column('MRR', 'int16'),
+    Column('Lifetime_Value', 'int32'),
+])
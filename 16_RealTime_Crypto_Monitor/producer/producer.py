@@ -1,6 +1,7 @@
 import time
 import json
 import random
+from datetime import datetime, timedelta, timezone
 import yfinance as yf
 from kafka import KafkaProducer
 
@@ -10,16 +11,31 @@ KAFKA_BROKER = 'localhost:9092'
 TOPIC_NAME = 'crypto_prices'
 SYMBOL = 'BTC-USD' # Yahoo Finance Ticker
 
+# The Ticker object (and its HTTP session) is created once and reused on every tick
+_ticker = None
+_last_quote_minute = None  # Minute of the last successful quote (1-minute bars change once a minute)
+QUOTE_WINDOW = timedelta(minutes=15)  # Small intraday window: only the latest bar is read
+
 def get_real_price():
     """
     Fetches the latest available price from Yahoo Finance API.
+    Returns None between minute boundaries (the caller keeps its last real price).
     """
+    global _ticker, _last_quote_minute
+    minute = int(time.time() // 60)
+    if minute == _last_quote_minute:
+        return None
     try:
-        ticker = yf.Ticker(SYMBOL)
-        # 'fast_info' provides the most recent price efficiently
-        return float(ticker.fast_info['last_price'])
-    except:
+        if _ticker is None:
+            _ticker = yf.Ticker(SYMBOL)
+        # Latest 1-minute bar. ('fast_info' memoizes its price on the Ticker object,
+        # so it would go stale when the same Ticker is reused between ticks.)
+        intraday = _ticker.history(start=datetime.now(timezone.utc) - QUOTE_WINDOW, interval='1m')
+        price = float(intraday['Close'].iloc[-1])
+    except Exception:
         return None
+    _last_quote_minute = minute
+    return price
 
 def run_producer():
     print(f"🚀 Starting Hybrid Producer (Real Data + Micro-Jitter) for {SYMBOL}...")
@@ -48,7 +64,7 @@ def run_producer():
             last_real_price = real_price
         
         # 2. Add "Micro-Jitter" to simulate high-frequency volatility
-        # Since Yahoo updates every ~10s, we add a random fluctuation (-$5 to +$5)
+        # The real quote is refreshed once a minute, so we add a random fluctuation (-$5 to +$5)
         # to keep the dashboard alive and fluid between real updates.
         jitter = random.uniform(-5.0, 5.0) 
         display_price = last_real_price + jitter
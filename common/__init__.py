@@ -0,0 +1,7 @@
+"""
+Helpers shared by the project folders.
+
+Install once from the repository root so every project script can import it:
+
+    pip install -e .
+"""
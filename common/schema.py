@@ -0,0 +1,157 @@
+"""
+Shared schema layer for the synthetic datasets.
+
+Each generator declares its output columns once, with compact in-memory dtypes:
+
+    HOSPITAL_SCHEMA = DatasetSchema('hospital_readmission_data', [
+        Column('Patient_ID', 'string'),
+        Column('Primary_Diagnosis', 'category', DIAGNOSES),
+        Column('Length_of_Stay_Days', 'int16'),
+        ...
+    ])
+
+Low-cardinality text columns become categoricals with a *fixed* category list
+(identical in every chunk and every run), counts and flags become small
+integers. `apply` casts a DataFrame to the schema and `write` / `DatasetWriter`
+save it as CSV (what the Power BI files read today) and/or Parquet, streaming
+chunk by chunk for very large datasets. `read` loads either format back with
+the declared dtypes.
+"""
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+FORMATS = ('csv', 'parquet')
+
+
+@dataclass(frozen=True)
+class Column:
+    """One column: a pandas dtype name ('category', 'string', 'int16', 'float32', 'datetime64[ns]', ...)."""
+    name: str
+    dtype: str
+    categories: Optional[Tuple] = None
+
+    def __post_init__(self):
+        if (self.dtype == 'category') != (self.categories is not None):
+            raise ValueError(f"Column '{self.name}': categories are required for (and only for) 'category'.")
+        if self.categories is not None:
+            object.__setattr__(self, 'categories', tuple(self.categories))
+
+    @property
+    def pandas_dtype(self):
+        if self.dtype == 'category':
+            return pd.CategoricalDtype(list(self.categories))
+        return self.dtype
+
+
+@dataclass
+class DatasetSchema:
+    name: str
+    columns: List[Column] = field(default_factory=list)
+
+    @property
+    def names(self) -> List[str]:
+        return [column.name for column in self.columns]
+
+    def dtypes(self) -> Dict[str, object]:
+        return {column.name: column.pandas_dtype for column in self.columns}
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Columns in schema order, cast to the declared dtypes. Unknown categories raise ValueError."""
+        missing = [name for name in self.names if name not in df.columns]
+        if missing:
+            raise ValueError(f"{self.name}: missing columns {missing}.")
+        out = {}
+        for column in self.columns:
+            values = df[column.name]
+            if column.dtype.startswith('datetime'):
+                out[column.name] = pd.to_datetime(values).astype(column.dtype)
+                continue
+            cast = values.astype(column.pandas_dtype)
+            if column.dtype == 'category':
+                unknown = cast.isna() & values.notna()
+                if unknown.any():
+                    raise ValueError(f"{self.name}.{column.name}: unknown categories "
+                                     f"{sorted(values[unknown].astype(str).unique())[:5]}.")
+            out[column.name] = cast
+        return pd.DataFrame(out, index=df.index)
+
+    def write(self, df: pd.DataFrame, path_stem: str, formats: Sequence[str] = FORMATS) -> List[str]:
+        """Writes `<path_stem>.csv` and/or `<path_stem>.parquet`; returns the paths written."""
+        with DatasetWriter(self, path_stem, formats) as writer:
+            writer.write(df)
+        return writer.paths
+
+    def read(self, path: str, **kwargs) -> pd.DataFrame:
+        """Loads a CSV or Parquet file written with this schema, with the declared dtypes."""
+        if path.endswith('.parquet'):
+            return self.apply(pd.read_parquet(path, **kwargs))
+        dates = [c.name for c in self.columns if c.dtype.startswith('datetime')]
+        dtypes = {name: dtype for name, dtype in self.dtypes().items() if name not in dates}
+        # Nullable integers may appear as floats in CSV: read them loosely, then cast
+        loose = {name: 'float64' for name, dtype in dtypes.items() if str(dtype).startswith(('int', 'uint'))}
+        return self.apply(pd.read_csv(path, dtype={**dtypes, **loose}, parse_dates=dates, **kwargs))
+
+
+class DatasetWriter:
+    """
+    Streams DataFrame chunks into CSV (appended) and/or Parquet (one row group per chunk).
+    Every chunk is cast with the schema first, so all row groups share one Parquet schema.
+
+        with DatasetWriter(HOSPITAL_SCHEMA, "hospital_readmission_data") as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+    """
+
+    def __init__(self, schema: DatasetSchema, path_stem: str, formats: Sequence[str] = FORMATS):
+        unknown = set(formats) - set(FORMATS)
+        if unknown or not formats:
+            raise ValueError(f"Unknown formats {sorted(unknown)}. Choose from {FORMATS}.")
+        self.schema = schema
+        self.paths = [f"{path_stem}.{fmt}" for fmt in FORMATS if fmt in formats]
+        self.rows = 0
+        self._csv_path = f"{path_stem}.csv" if 'csv' in formats else None
+        self._parquet_path = f"{path_stem}.parquet" if 'parquet' in formats else None
+        self._parquet_writer = None
+        if self._parquet_path is not None:
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as e:
+                raise ImportError("Parquet output requires 'pyarrow' (pip install pyarrow).") from e
+        for path in self.paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def write(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Casts `df` to the schema and appends it; returns the cast chunk."""
+        chunk = self.schema.apply(df)
+        if self._csv_path is not None:
+            chunk.to_csv(self._csv_path, mode='a', header=self.rows == 0, index=False)
+        if self._parquet_path is not None:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self._parquet_path, table.schema)
+            self._parquet_writer.write_table(table)
+        self.rows += len(chunk)
+        return chunk
+
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def memory_mb(df: pd.DataFrame) -> float:
+    """Deep in-memory size of a DataFrame in MB."""
+    return df.memory_usage(deep=True).sum() / 1e6